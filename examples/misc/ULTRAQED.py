@@ -4,9 +4,15 @@ A comprehensive multi-minute journey through the electromagnetic interaction
 Maximizing Manim v0.19.0 capabilities for visual storytelling
 """
 
+from pathlib import Path
+import sys
+
 from manim import *
 import numpy as np
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # examples/, for perf_helpers
+from perf_helpers import cached_mathtex
+
 # Ultra High Quality Color Palette
 COSMIC_BLUE = "#1a1a2e"
 ELECTRIC_CRIMSON = "#ff0055"
@@ -24,6 +30,10 @@ class ULTRAQEDComplete(ThreeDScene):
         # Initialize with cosmic background
         self.camera.background_color = BLACK
 
+        # Mobjects carried between scenes, keyed by name; the stars and
+        # corner title are kept as attributes since they persist to the end
+        self._scene_mobs: dict[str, Mobject] = {}
+
         # Scene 1: Cosmic Introduction
         self.scene_1_cosmic_opening()
 
@@ -253,28 +263,29 @@ class ULTRAQEDComplete(ThreeDScene):
             run_time=2
         )
 
-        self.axes = axes
-        self.axes_labels = axes_labels
-        self.light_cone = light_cone
-        self.metric_eq = metric_eq
-        self.metric_title = metric_title
+        self._scene_mobs["axes"] = axes
+        self._scene_mobs["axes_labels"] = axes_labels
+        self._scene_mobs["light_cone"] = light_cone
+        self._scene_mobs["metric_eq"] = metric_eq
+        self._scene_mobs["metric_title"] = metric_title
 
     def scene_3_quantum_fields(self):
         """Electromagnetic field visualization with dynamic waves"""
+        axes = self._scene_mobs["axes"]
 
         # Zoom into origin
         self.move_camera(
             phi=70*DEGREES,
             theta=-45*DEGREES,
-            frame_center=self.axes.c2p(0, 0, 0),
+            frame_center=axes.c2p(0, 0, 0),
             zoom=0.7,
             run_time=3
         )
 
         # Create sophisticated E and B field waves
         # Electric field (oscillating in x-direction)
-        E_wave = always_redraw(lambda: self.axes.plot_parametric_curve(
-            lambda t: self.axes.c2p(
+        E_wave = always_redraw(lambda: axes.plot_parametric_curve(
+            lambda t: axes.c2p(
                 0.5 * np.sin(5 * t - self.renderer.time * 2),
                 0,
                 t
@@ -285,8 +296,8 @@ class ULTRAQEDComplete(ThreeDScene):
         ))
 
         # Magnetic field (oscillating in y-direction, 90 degrees out of phase)
-        B_wave = always_redraw(lambda: self.axes.plot_parametric_curve(
-            lambda t: self.axes.c2p(
+        B_wave = always_redraw(lambda: axes.plot_parametric_curve(
+            lambda t: axes.c2p(
                 0,
                 0.5 * np.sin(5 * t - self.renderer.time * 2 + PI/2),
                 t
@@ -298,8 +309,8 @@ class ULTRAQEDComplete(ThreeDScene):
 
         # Propagation arrow
         prop_arrow = Arrow3D(
-            start=self.axes.c2p(0, 0, -3),
-            end=self.axes.c2p(0, 0, 3),
+            start=axes.c2p(0, 0, -3),
+            end=axes.c2p(0, 0, 3),
             color=PHOTON_GOLD,
             thickness=0.03,
             base_radius=0.08
@@ -310,13 +321,13 @@ class ULTRAQEDComplete(ThreeDScene):
             r"\vec{E}(z,t)",
             color=ELECTRIC_CRIMSON,
             font_size=48
-        ).rotate(PI/2, axis=RIGHT).move_to(self.axes.c2p(1, 0, 0))
+        ).rotate(PI/2, axis=RIGHT).move_to(axes.c2p(1, 0, 0))
 
         B_label = MathTex(
             r"\vec{B}(z,t)",
             color=MAGNETIC_SAPPHIRE,
             font_size=48
-        ).rotate(PI/2, axis=RIGHT).move_to(self.axes.c2p(0, 1, 0))
+        ).rotate(PI/2, axis=RIGHT).move_to(axes.c2p(0, 1, 0))
 
         k_label = MathTex(
             r"\vec{k}",
@@ -353,10 +364,10 @@ class ULTRAQEDComplete(ThreeDScene):
         self.wait(3)
 
         # Store for next scene
-        self.E_wave = E_wave
-        self.B_wave = B_wave
-        self.field_labels = VGroup(E_label, B_label, k_label, prop_arrow)
-        self.wave_eq = wave_eq
+        self._scene_mobs["E_wave"] = E_wave
+        self._scene_mobs["B_wave"] = B_wave
+        self._scene_mobs["field_labels"] = VGroup(E_label, B_label, k_label, prop_arrow)
+        self._scene_mobs["wave_eq"] = wave_eq
 
     def scene_4_maxwell_transformation(self):
         """Transform Maxwell equations to relativistic form"""
@@ -376,7 +387,7 @@ class ULTRAQEDComplete(ThreeDScene):
         self.add_fixed_in_frame_mobjects(maxwell_group)
 
         # Remove wave equation
-        self.remove(self.wave_eq)
+        self.remove(self._scene_mobs.pop("wave_eq"))
 
         self.play(
             Write(maxwell_title),
@@ -447,7 +458,7 @@ class ULTRAQEDComplete(ThreeDScene):
             run_time=2
         )
 
-        self.maxwell_compact = maxwell_compact
+        self._scene_mobs["maxwell_compact"] = maxwell_compact
 
     def scene_5_qed_lagrangian(self):
         """The heart of QED - Lagrangian density"""
@@ -462,12 +473,12 @@ class ULTRAQEDComplete(ThreeDScene):
 
         # Clear 3D elements
         self.play(
-            FadeOut(self.axes),
-            FadeOut(self.axes_labels),
-            FadeOut(self.light_cone),
-            FadeOut(self.E_wave),
-            FadeOut(self.B_wave),
-            FadeOut(self.field_labels),
+            FadeOut(self._scene_mobs.pop("axes")),
+            FadeOut(self._scene_mobs.pop("axes_labels")),
+            FadeOut(self._scene_mobs.pop("light_cone")),
+            FadeOut(self._scene_mobs.pop("E_wave")),
+            FadeOut(self._scene_mobs.pop("B_wave")),
+            FadeOut(self._scene_mobs.pop("field_labels")),
             run_time=2
         )
 
@@ -624,16 +635,17 @@ class ULTRAQEDComplete(ThreeDScene):
             run_time=2
         )
 
-        self.lagrangian_group = lagrangian_group
-        self.lagrangian = lagrangian
-        self.lagrangian_title = lagrangian_title
+        self._scene_mobs["lagrangian_group"] = lagrangian_group
+        self._scene_mobs["lagrangian_title"] = lagrangian_title
 
     def scene_6_feynman_interactions(self):
         """Feynman diagrams with multiple processes"""
 
+        lagrangian_group = self._scene_mobs["lagrangian_group"]
+        lagrangian_title = self._scene_mobs["lagrangian_title"]
         self.play(
-            self.lagrangian_group.animate.scale(0.5).to_corner(UR, buff=0.5),
-            self.lagrangian_title.animate.scale(0.5).next_to(self.lagrangian_group, UP, buff=0.2, aligned_edge=RIGHT),
+            lagrangian_group.animate.scale(0.5).to_corner(UR, buff=0.5),
+            lagrangian_title.animate.scale(0.5).next_to(lagrangian_group, UP, buff=0.2, aligned_edge=RIGHT),
             run_time=2
         )
 
@@ -740,15 +752,15 @@ class ULTRAQEDComplete(ThreeDScene):
         self.wait(3)
 
         # Store for next scene
-        self.feynman_diagrams = all_diagrams
-        self.feynman_title = feynman_title
+        self._scene_mobs["feynman_diagrams"] = all_diagrams
+        self._scene_mobs["feynman_title"] = feynman_title
 
     def scene_7_fine_structure(self):
         """Deep dive into the fine structure constant"""
 
         # Fade diagrams slightly
         self.play(
-            self.feynman_diagrams.animate.set_opacity(0.3),
+            self._scene_mobs["feynman_diagrams"].animate.set_opacity(0.3),
             run_time=1
         )
 
@@ -772,7 +784,7 @@ class ULTRAQEDComplete(ThreeDScene):
         self.add_fixed_in_frame_mobjects(alpha_group)
 
         self.play(
-            FadeOut(self.feynman_title),
+            FadeOut(self._scene_mobs.pop("feynman_title")),
             Write(alpha_title),
             run_time=2
         )
@@ -817,14 +829,14 @@ class ULTRAQEDComplete(ThreeDScene):
             run_time=2
         )
 
-        self.alpha_group = alpha_group
+        self._scene_mobs["alpha_group"] = alpha_group
 
     def scene_8_running_coupling(self):
         """Renormalization and energy-dependent coupling"""
 
         # Restore feynman diagrams opacity
         self.play(
-            self.feynman_diagrams.animate.set_opacity(0.15),
+            self._scene_mobs["feynman_diagrams"].animate.set_opacity(0.15),
             run_time=1
         )
 
@@ -921,18 +933,26 @@ class ULTRAQEDComplete(ThreeDScene):
         self.wait(4)
 
         # Store for next scene
-        self.running_graph = graph_group
-        self.renorm_title = renorm_title
-        self.renorm_explanation = explanation
+        self._scene_mobs["running_graph"] = graph_group
+        self._scene_mobs["renorm_title"] = renorm_title
+        self._scene_mobs["renorm_explanation"] = explanation
 
     def scene_9_vacuum_structure(self):
         """Vacuum polarization and virtual particles"""
+        # Draw every random parameter of the pairs up front
+        n_pairs = 20
+        rng = np.random.default_rng(0)
+        pair_x = rng.uniform(-5, 5, size=n_pairs)
+        pair_y = rng.uniform(-3, 2, size=n_pairs)
+        pair_scale = rng.uniform(0.15, 0.35, size=n_pairs)
+        shift_amt = rng.uniform(0.1, 0.5, size=n_pairs)
+        opacity_end = rng.uniform(0.3, 1.0, size=n_pairs)
 
         # Fade previous elements
         self.play(
-            FadeOut(self.running_graph),
-            FadeOut(self.renorm_explanation),
-            FadeOut(self.feynman_diagrams),
+            FadeOut(self._scene_mobs.pop("running_graph")),
+            FadeOut(self._scene_mobs.pop("renorm_explanation")),
+            FadeOut(self._scene_mobs.pop("feynman_diagrams")),
             run_time=2
         )
 
@@ -947,7 +967,7 @@ class ULTRAQEDComplete(ThreeDScene):
         self.add_fixed_in_frame_mobjects(vacuum_title)
 
         self.play(
-            FadeOut(self.renorm_title),
+            FadeOut(self._scene_mobs.pop("renorm_title")),
             Write(vacuum_title),
             run_time=2
         )
@@ -957,22 +977,18 @@ class ULTRAQEDComplete(ThreeDScene):
             electron = Circle(radius=scale, color=BLUE, fill_opacity=0.7).shift(position + LEFT*scale*1.5)
             positron = Circle(radius=scale, color=RED, fill_opacity=0.7).shift(position + RIGHT*scale*1.5)
 
-            e_label = MathTex("e^-", font_size=16).move_to(electron)
-            p_label = MathTex("e^+", font_size=16).move_to(positron)
+            e_label = cached_mathtex("e^-", font_size=16).move_to(electron)
+            p_label = cached_mathtex("e^+", font_size=16).move_to(positron)
 
             return VGroup(electron, e_label, positron, p_label)
 
         # Create multiple virtual pairs
         vacuum_pairs = VGroup(*[
             create_virtual_pair(
-                np.array([
-                    np.random.uniform(-5, 5),
-                    np.random.uniform(-3, 2),
-                    0
-                ]),
-                scale=np.random.uniform(0.15, 0.35)
+                np.array([pair_x[i], pair_y[i], 0]),
+                scale=pair_scale[i]
             )
-            for _ in range(20)
+            for i in range(n_pairs)
         ])
 
         self.add_fixed_in_frame_mobjects(vacuum_pairs)
@@ -980,15 +996,15 @@ class ULTRAQEDComplete(ThreeDScene):
         # Pairs bubble up
         self.play(
             LaggedStart(*[
-                FadeIn(pair, scale=0.1, shift=UP*np.random.uniform(0.1, 0.5))
-                for pair in vacuum_pairs
+                FadeIn(pair, scale=0.1, shift=UP*shift_amt[i])
+                for i, pair in enumerate(vacuum_pairs)
             ], lag_ratio=0.1),
             run_time=5
         )
 
         # Add shimmer effect
         self.play(
-            *[pair.animate.set_opacity(np.random.uniform(0.3, 1.0)) for pair in vacuum_pairs],
+            *[pair.animate.set_opacity(opacity_end[i]) for i, pair in enumerate(vacuum_pairs)],
             rate_func=there_and_back,
             run_time=2
         )
@@ -1018,29 +1034,22 @@ class ULTRAQEDComplete(ThreeDScene):
             run_time=2
         )
 
-        self.vacuum_title = vacuum_title
+        # Drop the pairs for good so later frames don't traverse them
+        self.remove(vacuum_pairs, vacuum_explanation)
+        self.remove_fixed_in_frame_mobjects(vacuum_pairs, vacuum_explanation)
+
+        self._scene_mobs["vacuum_title"] = vacuum_title
 
     def scene_10_synthesis(self):
         """Grand synthesis bringing everything together"""
 
-        cleanup_targets = [
-            "vacuum_title",
-            "lagrangian_group",
-            "lagrangian_title",
-            "maxwell_compact",
-            "metric_eq",
-            "metric_title",
-            "alpha_group",
-            "running_graph",
-            "renorm_title",
-            "renorm_explanation",
-            "feynman_diagrams",
-        ]
-        to_fade = [getattr(self, name) for name in cleanup_targets if hasattr(self, name)]
+        # Everything still on screen from earlier scenes is in _scene_mobs
+        to_fade = list(self._scene_mobs.values())
         if to_fade:
             self.play(*[FadeOut(mob) for mob in to_fade], run_time=2)
             for mob in to_fade:
                 self.remove_fixed_in_frame_mobjects(mob)
+        self._scene_mobs.clear()
 
         # Final synthesis title
         synthesis_title = Text(
@@ -1059,7 +1068,7 @@ class ULTRAQEDComplete(ThreeDScene):
         )
 
         # Central Lagrangian hub
-        mini_lagrangian = MathTex(
+        mini_lagrangian = cached_mathtex(
             r"\mathcal{L}_{\text{QED}} = \bar{\psi}(i\gamma^\mu D_\mu - m)\psi - \frac{1}{4}F_{\mu\nu}F^{\mu\nu}",
             font_size=34,
         ).scale(0.95)
@@ -1072,16 +1081,16 @@ class ULTRAQEDComplete(ThreeDScene):
         })
 
         # Supporting elements positioned with generous spacing
-        mini_maxwell = MathTex(
+        mini_maxwell = cached_mathtex(
             r"\partial_\mu F^{\mu\nu} = \mu_0 J^\nu",
             font_size=30,
         ).scale(0.9)
-        mini_alpha = MathTex(
+        mini_alpha = cached_mathtex(
             r"\alpha \approx \frac{1}{137}",
             font_size=30,
             color=PHOTON_GOLD,
         ).scale(0.9)
-        mini_gauge = MathTex(
+        mini_gauge = cached_mathtex(
             r"U(1)",
             font_size=36,
             color=QUANTUM_VIOLET,
@@ -1119,7 +1128,7 @@ class ULTRAQEDComplete(ThreeDScene):
         self.add_fixed_in_frame_mobjects(synthesis_elements)
 
         self.play(
-            LaggedStart(*[FadeIn(elem, scale=0.5) for elem in synthesis_elements], lag_ratio=0.25),
+            FadeIn(synthesis_elements, scale=0.5, lag_ratio=0.25),
             run_time=4,
         )
         self.wait(2)
@@ -1144,7 +1153,7 @@ class ULTRAQEDComplete(ThreeDScene):
 
         self.add_fixed_in_frame_mobjects(connections)
         self.play(
-            LaggedStart(*[Create(arrow) for arrow in connections], lag_ratio=0.2),
+            Create(connections, lag_ratio=0.2),
             run_time=3,
         )
         self.wait(3)
@@ -1163,28 +1172,20 @@ class ULTRAQEDComplete(ThreeDScene):
         )
         self.wait(4)
 
-        self.synthesis_title = synthesis_title
-        self.synthesis_elements = synthesis_elements
-        self.connections = connections
-        self.summary_text = summary_text
+        self._scene_mobs["synthesis_title"] = synthesis_title
+        self._scene_mobs["synthesis_elements"] = synthesis_elements
+        self._scene_mobs["connections"] = connections
+        self._scene_mobs["summary_text"] = summary_text
 
     def scene_11_finale(self):
         """Epic cosmic finale"""
 
         # Fade all synthesis elements
         self.play(
-            FadeOut(self.synthesis_title),
-            FadeOut(self.synthesis_elements),
-            FadeOut(self.connections),
-            FadeOut(self.summary_text),
-            FadeOut(self.lagrangian_group),
-            FadeOut(self.lagrangian_title),
-            FadeOut(self.maxwell_compact),
-            FadeOut(self.metric_eq),
-            FadeOut(self.metric_title),
-            FadeOut(self.alpha_group),
+            *[FadeOut(mob) for mob in self._scene_mobs.values()],
             run_time=3
         )
+        self._scene_mobs.clear()
 
         # Bring back stars with increased opacity
         self.play(
@@ -1228,13 +1229,21 @@ class ULTRAQEDComplete(ThreeDScene):
             run_time=4
         )
 
-        # Hold with subtle glow
-        for _ in range(3):
-            self.play(
-                final_message[0].animate.set_color(WHITE),
-                rate_func=there_and_back,
-                run_time=1.5
-            )
+        # Hold with subtle glow: three white pulses in a single animation,
+        # blending each glyph from its own gradient color
+        qed_glyphs = final_message[0]
+        glyph_colors = [glyph.get_color() for glyph in qed_glyphs]
+
+        def glow(mob, alpha):
+            weight = 0.5 * (1 - np.cos(6 * PI * alpha))
+            for glyph, color in zip(mob, glyph_colors):
+                glyph.set_color(interpolate_color(color, WHITE, weight))
+
+        self.play(
+            UpdateFromAlphaFunc(qed_glyphs, glow),
+            rate_func=linear,
+            run_time=4.5
+        )
 
         self.wait(3)
 
@@ -4,6 +4,14 @@ import numpy as np
 # Aesthethic Configuration
 config.background_color = "#F5F5F0"  # Off-white gallery look
 
+# The 8 tilts used to distribute fibers around each torus never change,
+# so build their 3x3 rotations once instead of per fiber
+N_TILTS = 8
+TILT_ROTS = np.stack([
+    rotation_matrix(tilt, OUT)[:3, :3]
+    for tilt in np.linspace(0, TAU, N_TILTS, endpoint=False)
+]).astype(np.float32)
+
 class HopfFibrationEpic(ThreeDScene):
     def construct(self):
         # 1. Set up Camera and Lighting Feel
@@ -45,7 +53,7 @@ class HopfFibrationEpic(ThreeDScene):
                 SZ = x2 / denom
                 
                 path_points.append([SX, SY, SZ])
-            return np.array(path_points)
+            return np.asarray(path_points, dtype=np.float32)
 
         # 4. Generate the Bundle
         fibers = VGroup()
@@ -60,14 +68,13 @@ class HopfFibrationEpic(ThreeDScene):
         for i, eta in enumerate(np.linspace(0.2, 1.4, 5)):
             c = colors[i % len(colors)]
             # Create a ring of fibers for this torus shell
-            for tilt in np.linspace(0, TAU, 8, endpoint=False):
+            for j in range(N_TILTS):
                 # We rotate the path points to populate the torus surface
                 raw_points = get_fiber_points(eta)
                 
                 # Manual rotation hack to distribute fibers on the torus
                 # (Simplification for visual impact over pure strict math fidelity)
-                rot_matrix = rotation_matrix(tilt, OUT)
-                rotated_points = np.dot(raw_points, rot_matrix[:3,:3].T)
+                rotated_points = (raw_points @ TILT_ROTS[j].T).astype(np.float32, copy=False)
                 
                 # Create the Fiber Object
                 fiber = VMobject()
@@ -77,7 +84,9 @@ class HopfFibrationEpic(ThreeDScene):
                 # Create the Reflection (Ghost Object)
                 reflection = fiber.copy()
                 # Flip across Z and shift down twice the distance to floor
-                reflection.apply_function(lambda p: np.array([p[0], p[1], -p[2] + 2*floor_level]))
+                reflected_points = reflection.points.copy()
+                reflected_points[:, 2] = -reflected_points[:, 2] + 2*floor_level
+                reflection.set_points(reflected_points)
                 reflection.set_stroke(color=GRAY, width=1, opacity=0.1)
                 reflection.set_shade_in_3d(False)
 
@@ -52,41 +52,40 @@ class InscribedShapes(ThreeDScene):
             human.animate.shift(UP * (human_height/2)),  # Move human up to stand on floor
         )
 
-        # We'll do it more simply by creating a 3D VGroup of faces:
-        roof_faces = VGroup()
-        
+        # The roof is a single VMobject holding all four faces as closed
+        # subpaths, so fill/stroke are set once and it draws as one mobject
+        roof = VMobject()
+
         # Calculate roof points
         apex_z = house_height + roof_height
-        
-        # Face 1 (front slope): triangle with points: front-left, front-right, apex front
+
         front_left  = np.array([ -house_width/2, -house_depth/2, house_height])
         front_right = np.array([  house_width/2, -house_depth/2, house_height])
         apex_front  = np.array([ 0, -house_depth/2, apex_z])
-        face_front = Polygon(front_left, front_right, apex_front)
-        face_front.set_fill(ORANGE, opacity=0.7).set_stroke(ORANGE, opacity=0.9)
-
-        # Face 2 (back slope): triangle with points: back-left, back-right, apex back
         back_left  = np.array([ -house_width/2, house_depth/2, house_height])
         back_right = np.array([  house_width/2, house_depth/2, house_height])
         apex_back  = np.array([ 0, house_depth/2, apex_z])
-        face_back = Polygon(back_left, back_right, apex_back)
-        face_back.set_fill(ORANGE, opacity=0.7).set_stroke(ORANGE, opacity=0.9)
-
-        # Face 3 (left roof plane): quad with points: front_left, apex_front, apex_back, back_left
-        face_left = Polygon(front_left, apex_front, apex_back, back_left)
-        face_left.set_fill(ORANGE, opacity=0.7).set_stroke(ORANGE, opacity=0.9)
 
-        # Face 4 (right roof plane): quad with points: front_right, apex_front, apex_back, back_right
-        face_right = Polygon(front_right, apex_front, apex_back, back_right)
-        face_right.set_fill(ORANGE, opacity=0.7).set_stroke(ORANGE, opacity=0.9)
+        roof_faces = [
+            # Face 1 (front slope): triangle front-left, front-right, apex front
+            [front_left, front_right, apex_front],
+            # Face 2 (back slope): triangle back-left, back-right, apex back
+            [back_left, back_right, apex_back],
+            # Face 3 (left roof plane): quad front_left, apex_front, apex_back, back_left
+            [front_left, apex_front, apex_back, back_left],
+            # Face 4 (right roof plane): quad front_right, apex_front, apex_back, back_right
+            [front_right, apex_front, apex_back, back_right],
+        ]
+        for face in roof_faces:
+            roof.start_new_path(face[0])
+            roof.add_points_as_corners([*face[1:], face[0]])
+        roof.set_fill(ORANGE, opacity=0.7).set_stroke(ORANGE, opacity=0.9)
 
-        roof_faces.add(face_front, face_back, face_left, face_right)
-        
         # Animate the roof appearing
-        self.play(Create(roof_faces, run_time=1.5))
+        self.play(Create(roof, run_time=1.5))
 
         # Combine the house (walls + roof) into one group
-        house = VGroup(walls, roof_faces)
+        house = VGroup(walls, roof)
         house_and_human = VGroup(house, human)
 
         # ------------------------------------------------------------------
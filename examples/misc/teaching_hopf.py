@@ -1,11 +1,70 @@
+from pathlib import Path
+import sys
+
 from manim import *
 import numpy as np
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # examples/, for perf_helpers
+from perf_helpers import njit, prange
+
 # Aesthetic Configuration
 config.background_color = "#F5F5F0"
 config.pixel_height = 1080
 config.pixel_width = 1920
 
+
+# --- Hopf Fiber Kernels ---
+# Standard torus parametrization of S3:
+# z1 = cos(eta) * exp(i * xi1)
+# z2 = sin(eta) * exp(i * (xi1 + phi))
+# followed by stereographic projection from (0, 0, 0, 1). Both kernels
+# return an (n_eta, n_phi, n_points, 3) array holding every fiber of the
+# bundle in float32, so the whole geometry is produced in one call.
+#
+# Since |y2| <= 1 the denominator 1 - y2 is never negative, so guarding the
+# antipode is a plain clamp; it is inverted once and multiplied through.
+
+def hopf_fibers_numpy(etas, phis, n_points):
+    xi1 = np.linspace(0, TAU, n_points)
+    eta = etas[:, None, None]
+    angle = xi1[None, None, :] + phis[None, :, None]
+
+    x1 = np.cos(eta) * np.cos(xi1)
+    y1 = np.cos(eta) * np.sin(xi1)
+    x2 = np.sin(eta) * np.cos(angle)
+    y2 = np.sin(eta) * np.sin(angle)
+
+    denom = 1 - y2
+    np.clip(denom, 0.001, None, out=denom)
+    inv = 1.0 / denom
+    points = np.stack(np.broadcast_arrays(x1 * inv, y1 * inv, x2 * inv), axis=-1)
+    return points.astype(np.float32, copy=False)
+
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def hopf_fibers(etas, phis, n_points):
+        n_eta = etas.shape[0]
+        n_phi = phis.shape[0]
+        out = np.empty((n_eta, n_phi, n_points, 3), dtype=np.float32)
+        step = TAU / (n_points - 1)
+        for flat in prange(n_eta * n_phi):
+            i = flat // n_phi
+            k = flat % n_phi
+            cos_eta = np.cos(etas[i])
+            sin_eta = np.sin(etas[i])
+            for n in range(n_points):
+                xi1 = n * step
+                y2 = sin_eta * np.sin(xi1 + phis[k])
+                inv = 1.0 / max(1 - y2, 0.001)
+                out[i, k, n, 0] = cos_eta * np.cos(xi1) * inv
+                out[i, k, n, 1] = cos_eta * np.sin(xi1) * inv
+                out[i, k, n, 2] = sin_eta * np.cos(xi1 + phis[k]) * inv
+        return out
+else:
+    hopf_fibers = hopf_fibers_numpy
+
+
 class TeachingHopf(ThreeDScene):
     def construct(self):
         # --- Setup ---
@@ -31,46 +90,34 @@ class TeachingHopf(ThreeDScene):
         # --- Helper Functions ---
         floor_level = -3
         
-        def get_fiber_points(eta, phi_start=0, n_points=100):
+        # set_points_smoothly fits cubic handles through the samples, so the
+        # thin bundle fibers need far fewer than the thick hero fibers
+        n_points = 32
+        hero_n_points = 100
+
+        def get_fiber_points(eta, phi_start=0, n_points=n_points):
             # eta: torus selector (0 to pi/2)
             # phi_start: fiber selector on that torus
-            xi1_range = np.linspace(0, TAU, n_points)
-            path_points = []
-            for xi1 in xi1_range:
-                # Hopf Map Inverse param
-                # z1 = exp(i * (xi1 + xi2)) * sin(eta) ? No, let's use the standard param
-                # Standard Torus parametrization of S3:
-                # z1 = cos(eta) * exp(i * xi1)
-                # z2 = sin(eta) * exp(i * (xi1 + phi_start)) 
-                # This ensures they are fibers.
-                
-                p0 = np.cos(eta) * np.exp(1j * xi1)
-                p1 = np.sin(eta) * np.exp(1j * (xi1 + phi_start))
-                
-                # Stereographic Projection
-                x1, y1 = p0.real, p0.imag
-                x2, y2 = p1.real, p1.imag
-                
-                denom = 1 - y2
-                if abs(denom) < 0.001: denom = 0.001
-                
-                path_points.append([x1/denom, y1/denom, x2/denom])
-            return np.array(path_points)
+            return hopf_fibers(
+                np.array([eta], dtype=float),
+                np.array([phi_start], dtype=float),
+                n_points,
+            )[0, 0]
 
         # --- Geometry Creation ---
         fibers_all = VGroup()
-        reflections_all = VGroup()
         
         # Create a nice dense bundle
         colors = [TEAL_E, BLUE_E, PURPLE_E, MAROON_E]
         etas = np.linspace(0.3, 1.2, 4) # 4 Layers
+        n_fibers = 8
+        phis = np.arange(n_fibers) * TAU / n_fibers
+        shell_points = hopf_fibers(etas, phis, n_points)
         
         for i, eta in enumerate(etas):
             c = colors[i]
-            n_fibers = 8
-            for k in range(n_fibers):
-                phi = k * TAU / n_fibers
-                pts = get_fiber_points(eta, phi)
+            for k, phi in enumerate(phis):
+                pts = shell_points[i, k]
                 
                 # Rotate to look nice
                 # The stereographic projection is already 3D, but let's orient it
@@ -80,20 +127,21 @@ class TeachingHopf(ThreeDScene):
                 fiber = VMobject()
                 fiber.set_points_smoothly(pts)
                 fiber.set_stroke(c, width=4, opacity=0.8)
-                
-                # Reflection
-                refl = fiber.copy()
-                refl.apply_function(lambda p: np.array([p[0], p[1], -p[2] + 2*floor_level]))
-                refl.set_stroke(color=GRAY, width=1, opacity=0.15)
-                
                 fibers_all.add(fiber)
-                reflections_all.add(refl)
+
+        # Reflections: mirror z -> -z + 2*floor_level for the whole bundle in
+        # one array op. The fibers are closed loops, so their concatenated
+        # curves form one VMobject with a separate subpath per fiber
+        all_pts = np.concatenate([fiber.points for fiber in fibers_all])
+        reflections_all = VMobject()
+        reflections_all.set_points(all_pts * [1, 1, -1] + [0, 0, 2 * floor_level])
+        reflections_all.set_stroke(color=GRAY, width=1, opacity=0.15)
 
         # Special "Linked Pair" for later
-        link_fiber_1 = VMobject().set_points_smoothly(get_fiber_points(0.5, 0))
+        link_fiber_1 = VMobject().set_points_smoothly(get_fiber_points(0.5, 0, hero_n_points))
         link_fiber_1.set_stroke(RED, width=8, opacity=1)
         
-        link_fiber_2 = VMobject().set_points_smoothly(get_fiber_points(1.0, PI/2))
+        link_fiber_2 = VMobject().set_points_smoothly(get_fiber_points(1.0, PI/2, hero_n_points))
         link_fiber_2.set_stroke(ORANGE, width=8, opacity=1)
         
         linked_pair = VGroup(link_fiber_1, link_fiber_2)
@@ -102,7 +150,20 @@ class TeachingHopf(ThreeDScene):
         
         # 1. Intro
         self.play(Write(title))
-        self.play(Create(fibers_all, lag_ratio=0.01, run_time=3), FadeIn(reflections_all))
+        # Reveal every fiber from one shared tracker: each frame truncates the
+        # fibers against a single pre-built full copy of the bundle
+        full_fibers = fibers_all.copy()
+        reveal = ValueTracker(0)
+
+        def reveal_fibers(group):
+            t = reveal.get_value()
+            for fiber, full in zip(group, full_fibers):
+                fiber.pointwise_become_partial(full, 0, t)
+
+        fibers_all.add_updater(reveal_fibers)
+        self.add(fibers_all)
+        self.play(reveal.animate(run_time=3).set_value(1), FadeIn(reflections_all))
+        fibers_all.remove_updater(reveal_fibers)
         self.wait()
         
         # 2. Show Equations
@@ -127,9 +188,26 @@ class TeachingHopf(ThreeDScene):
         self.play(Create(linked_pair, run_time=2))
         
         # Rotate to show the link structure clearly
-        self.move_camera(phi=30 * DEGREES, theta=120 * DEGREES, run_time=3)
-        self.wait()
-        self.move_camera(phi=70 * DEGREES, theta=30 * DEGREES, run_time=3)
+        # One continuous out-pause-back sweep (3s, 1s hold, 3s) driven by a
+        # single tracker instead of two move_camera calls and a wait
+        home = np.array([70 * DEGREES, 30 * DEGREES])
+        link_view = np.array([30 * DEGREES, 120 * DEGREES])
+        sweep = ValueTracker(0)
+
+        def steer_camera(tracker):
+            phi, theta = interpolate(home, link_view, tracker.get_value())
+            self.camera.set_phi(phi)
+            self.camera.set_theta(theta)
+
+        sweep.add_updater(steer_camera)
+        self.add(sweep)
+        self.play(
+            sweep.animate.set_value(1),
+            rate_func=lambda t: there_and_back_with_pause(t, pause_ratio=1 / 7),
+            run_time=7
+        )
+        sweep.remove_updater(steer_camera)
+        self.remove(sweep)
         
         # 5. Re-Integrate
         self.play(
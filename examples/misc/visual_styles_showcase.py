@@ -19,9 +19,70 @@ Render with: manim -pqh visual_styles_showcase.py All3DStyles
 Author: Math-To-Manim - Everything in glorious 3D!
 """
 
+from functools import lru_cache
+from pathlib import Path
+import sys
+
 from manim import *
 import numpy as np
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # examples/, for perf_helpers
+from perf_helpers import vectorized_surface
+
+
+# ==============================================================================
+# HELPERS
+# ==============================================================================
+
+@lru_cache(maxsize=None)
+def _build_primitive(cls, **kwargs):
+    return cls(**kwargs)
+
+
+def cached_primitive(cls, **kwargs):
+    """Return a fresh copy of a primitive solid, tessellating each
+    (class, parameters) combination only once per process."""
+    return _build_primitive(cls, **kwargs).copy()
+
+
+def make_starfield(n, r_range, opacity_range, seed, star_size=2, n_sizes=1):
+    """Build a background starfield as a single point-cloud mobject.
+
+    Stars are drawn on a spherical shell with radii in ``r_range``; all
+    positions and opacities come from one vectorized draw, and the whole
+    field renders as one PMobject instead of ``n`` Dot3D spheres.
+
+    ``star_size`` is the point size in pixels. Passing a ``(min, max)``
+    range with ``n_sizes > 1`` splits the stars into that many size
+    classes, each a child point cloud, to keep some size variety.
+    """
+    rng = np.random.default_rng(seed)
+    theta = rng.uniform(0, TAU, n)
+    phi = rng.uniform(0, PI, n)
+    r = rng.uniform(*r_range, n)
+    coords = np.stack([
+        r * np.sin(phi) * np.cos(theta),
+        r * np.sin(phi) * np.sin(theta),
+        r * np.cos(phi),
+    ], axis=1).astype(np.float32)
+
+    rgbas = np.ones((n, 4))
+    rgbas[:, 3] = rng.uniform(*opacity_range, n)
+
+    if n_sizes == 1:
+        stars = PMobject(stroke_width=star_size)
+        stars.add_points(coords, rgbas=rgbas)
+        return stars
+
+    size_class = rng.integers(0, n_sizes, n)
+    stars = PMobject()
+    for k, size in enumerate(np.linspace(*star_size, n_sizes)):
+        in_class = size_class == k
+        cloud = PMobject(stroke_width=size)
+        cloud.add_points(coords[in_class], rgbas=rgbas[in_class])
+        stars.add(cloud)
+    return stars
+
 
 # ==============================================================================
 # STYLE 1: WARM SUNSET - 3D TORUS KNOT
@@ -37,7 +98,8 @@ class SunsetTorus3D(ThreeDScene):
         self.set_camera_orientation(phi=70 * DEGREES, theta=-45 * DEGREES, zoom=0.8)
         
         # Create a torus
-        torus = Torus(
+        torus = cached_primitive(
+            Torus,
             major_radius=2,
             minor_radius=0.6,
             resolution=(30, 30)
@@ -91,12 +153,10 @@ class OceanWave3D(ThreeDScene):
         
         # Create wave surface
         def wave_func(u, v):
-            x = u
-            y = v
             z = 0.3 * np.sin(2 * u) * np.cos(2 * v) + 0.2 * np.sin(3 * u + v)
-            return np.array([x, y, z])
+            return u, v, z
         
-        wave_surface = Surface(
+        wave_surface = vectorized_surface(
             wave_func,
             u_range=[-3, 3],
             v_range=[-3, 3],
@@ -106,18 +166,20 @@ class OceanWave3D(ThreeDScene):
         wave_surface.set_opacity(0.85)
         
         # Create "bubbles" as 3D spheres
+        # Every bubble is a scaled copy of one tessellated unit sphere
+        bubble_template = cached_primitive(Sphere, radius=1, resolution=(8, 8))
+        bubble_template.set_color("#80deea")
+        bubble_template.set_opacity(0.5)
+
+        n_bubbles = 30
+        rng = np.random.default_rng(42)
+        coords = rng.uniform([-3, -3, -2], [3, 3, 0], size=(n_bubbles, 3))
+        radii = rng.uniform(0.05, 0.15, n_bubbles)
+
         bubbles = VGroup()
-        np.random.seed(42)
-        for _ in range(30):
-            x = np.random.uniform(-3, 3)
-            y = np.random.uniform(-3, 3)
-            z = np.random.uniform(-2, 0)
-            r = np.random.uniform(0.05, 0.15)
-            
-            bubble = Sphere(radius=r, resolution=(8, 8))
-            bubble.move_to([x, y, z])
-            bubble.set_color("#80deea")
-            bubble.set_opacity(0.5)
+        for i in range(n_bubbles):
+            bubble = bubble_template.copy().scale(radii[i])
+            bubble.move_to(coords[i])
             bubbles.add(bubble)
         
         # Title
@@ -144,12 +206,21 @@ class OceanWave3D(ThreeDScene):
         self.play(Write(wave_eq))
         
         # Bubble animation + camera rotation
+        # One tracker drives every bubble's rise instead of 30 animations
+        rise = rng.uniform(1, 3, n_bubbles)[:, None] * UP
+        start_centers = np.array([b.get_center() for b in bubbles])
+        rise_tracker = ValueTracker(0)
+
+        def lift_bubbles(group):
+            targets = start_centers + rise_tracker.get_value() * rise
+            for bubble, target in zip(group, targets):
+                bubble.move_to(target)
+
+        bubbles.add_updater(lift_bubbles)
         self.begin_ambient_camera_rotation(rate=0.15)
-        self.play(
-            *[b.animate.shift(UP * np.random.uniform(1, 3)) for b in bubbles],
-            run_time=4
-        )
+        self.play(rise_tracker.animate.set_value(1), run_time=4)
         self.stop_ambient_camera_rotation()
+        bubbles.remove_updater(lift_bubbles)
         
         self.wait(1)
 
@@ -184,13 +255,13 @@ class NeonPolyhedron3D(ThreeDScene):
         grid.shift(DOWN * 2)
         
         # Create glowing icosahedron
-        icosa = Icosahedron(edge_length=2)
+        icosa = cached_primitive(Icosahedron, edge_length=2)
         icosa.set_color("#00ffff")
         icosa.set_stroke("#ff00ff", width=3)
         icosa.set_fill(opacity=0.2)
         
         # Create outer dodecahedron
-        dodeca = Dodecahedron(edge_length=1.5)
+        dodeca = cached_primitive(Dodecahedron, edge_length=1.5)
         dodeca.set_color("#ff00ff")
         dodeca.set_stroke("#00ffff", width=2)
         dodeca.set_fill(opacity=0.1)
@@ -252,9 +323,9 @@ class MinimalistMobius3D(ThreeDScene):
             x = (1 + v/2 * np.cos(u/2)) * np.cos(u)
             y = (1 + v/2 * np.cos(u/2)) * np.sin(u)
             z = v/2 * np.sin(u/2)
-            return np.array([x, y, z])
+            return x, y, z
         
-        mobius = Surface(
+        mobius = vectorized_surface(
             mobius_func,
             u_range=[0, TAU],
             v_range=[-0.5, 0.5],
@@ -265,13 +336,8 @@ class MinimalistMobius3D(ThreeDScene):
         mobius.scale(1.5)
         
         # Edge curve for emphasis
-        edge_points = []
-        for u in np.linspace(0, TAU, 100):
-            v = 0.5
-            x = (1 + v/2 * np.cos(u/2)) * np.cos(u)
-            y = (1 + v/2 * np.cos(u/2)) * np.sin(u)
-            z = v/2 * np.sin(u/2)
-            edge_points.append([x * 1.5, y * 1.5, z * 1.5])
+        u = np.linspace(0, TAU, 100)
+        edge_points = (np.stack(mobius_func(u, 0.5), axis=1) * 1.5).astype(np.float32)
         
         edge = VMobject()
         edge.set_points_smoothly(edge_points)
@@ -323,15 +389,14 @@ class ForestSpiral3D(ThreeDScene):
         # Create 3D golden spiral shell (nautilus-like)
         def spiral_shell(u, v):
             # Golden ratio-based spiral
-            phi_gr = (1 + np.sqrt(5)) / 2
             r = np.exp(0.2 * u)
             
             x = r * np.cos(u) * (1 + 0.3 * np.cos(v))
             y = r * np.sin(u) * (1 + 0.3 * np.cos(v))
             z = r * 0.3 * np.sin(v) + u * 0.15
-            return np.array([x, y, z]) * 0.4
+            return x * 0.4, y * 0.4, z * 0.4
         
-        shell = Surface(
+        shell = vectorized_surface(
             spiral_shell,
             u_range=[0, 4 * PI],
             v_range=[0, TAU],
@@ -341,19 +406,20 @@ class ForestSpiral3D(ThreeDScene):
         shell.set_opacity(0.9)
         
         # Floating "leaves" (small green spheres)
+        leaf_template = cached_primitive(Sphere, radius=1, resolution=(6, 6))
+        n_leaves = 25
+        rng = np.random.default_rng(123)
+        coords = rng.uniform([-4, -4, -2], [4, 4, 3], size=(n_leaves, 3))
+        radii = rng.uniform(0.08, 0.2, n_leaves)
+        leaf_colors = rng.choice(["#8bc34a", "#4caf50", "#81c784"], size=n_leaves)
+        opacities = rng.uniform(0.3, 0.6, n_leaves)
+
         leaves = VGroup()
-        np.random.seed(123)
-        for _ in range(25):
-            x = np.random.uniform(-4, 4)
-            y = np.random.uniform(-4, 4)
-            z = np.random.uniform(-2, 3)
-            r = np.random.uniform(0.08, 0.2)
-            
-            leaf = Sphere(radius=r, resolution=(6, 6))
-            leaf.move_to([x, y, z])
-            color = np.random.choice(["#8bc34a", "#4caf50", "#81c784"])
-            leaf.set_color(color)
-            leaf.set_opacity(np.random.uniform(0.3, 0.6))
+        for i in range(n_leaves):
+            leaf = leaf_template.copy().scale(radii[i])
+            leaf.move_to(coords[i])
+            leaf.set_color(leaf_colors[i])
+            leaf.set_opacity(opacities[i])
             leaves.add(leaf)
         
         # Title
@@ -398,29 +464,18 @@ class CosmicGravity3D(ThreeDScene):
         self.set_camera_orientation(phi=65 * DEGREES, theta=-45 * DEGREES, zoom=0.6)
         
         # Create starfield
-        stars = VGroup()
-        np.random.seed(77)
-        for _ in range(200):
-            theta = np.random.uniform(0, TAU)
-            phi = np.random.uniform(0, PI)
-            r = np.random.uniform(8, 15)
-            
-            x = r * np.sin(phi) * np.cos(theta)
-            y = r * np.sin(phi) * np.sin(theta)
-            z = r * np.cos(phi)
-            
-            star_r = np.random.uniform(0.02, 0.06)
-            star = Dot3D(point=[x, y, z], radius=star_r, color=WHITE)
-            star.set_opacity(np.random.uniform(0.3, 1.0))
-            stars.add(star)
+        stars = make_starfield(
+            200, r_range=(8, 15), opacity_range=(0.3, 1.0), seed=77,
+            star_size=(2, 5), n_sizes=3
+        )
         
         # Create gravitational well (curved spacetime)
         def gravity_well(u, v):
             r = np.sqrt(u**2 + v**2) + 0.01
             z = -2 / (r + 0.5) + 0.5
-            return np.array([u, v, z])
+            return u, v, z
         
-        spacetime = Surface(
+        spacetime = vectorized_surface(
             gravity_well,
             u_range=[-4, 4],
             v_range=[-4, 4],
@@ -430,13 +485,13 @@ class CosmicGravity3D(ThreeDScene):
         spacetime.set_opacity(0.7)
         
         # Central "black hole" sphere
-        black_hole = Sphere(radius=0.3, resolution=(20, 20))
+        black_hole = cached_primitive(Sphere, radius=0.3, resolution=(20, 20))
         black_hole.move_to([0, 0, -2.5])
         black_hole.set_color("#000000")
         black_hole.set_opacity(1)
         
         # Accretion ring
-        ring = Torus(major_radius=0.8, minor_radius=0.1)
+        ring = cached_primitive(Torus, major_radius=0.8, minor_radius=0.1)
         ring.move_to([0, 0, -1.5])
         ring.rotate(PI/6, axis=RIGHT)
         ring.set_color_by_gradient("#ff6f00", "#ff8f00", "#ffa000")
@@ -493,20 +548,7 @@ class All3DStyles(ThreeDScene):
         self.set_camera_orientation(phi=70 * DEGREES, theta=-45 * DEGREES, zoom=0.6)
         
         # Create starfield background
-        stars = VGroup()
-        np.random.seed(99)
-        for _ in range(150):
-            theta = np.random.uniform(0, TAU)
-            phi = np.random.uniform(0, PI)
-            r = np.random.uniform(10, 20)
-            
-            x = r * np.sin(phi) * np.cos(theta)
-            y = r * np.sin(phi) * np.sin(theta)
-            z = r * np.cos(phi)
-            
-            star = Dot3D(point=[x, y, z], radius=0.03, color=WHITE)
-            star.set_opacity(np.random.uniform(0.3, 0.8))
-            stars.add(star)
+        stars = make_starfield(150, r_range=(10, 20), opacity_range=(0.3, 0.8), seed=99)
         
         self.add(stars)
         
@@ -523,12 +565,12 @@ class All3DStyles(ThreeDScene):
         
         # Style objects
         styles = [
-            ("Sunset", Torus(major_radius=1, minor_radius=0.3), "#ff6b6b"),
-            ("Ocean", Sphere(radius=0.8), "#00b4d8"),
-            ("Cyber", Icosahedron(edge_length=1.2), "#00ffff"),
-            ("Minimal", Cube(side_length=1.2), "#3498db"),
-            ("Nature", Cone(base_radius=0.8, height=1.5), "#4caf50"),
-            ("Cosmic", Dodecahedron(edge_length=0.8), "#9c27b0"),
+            ("Sunset", cached_primitive(Torus, major_radius=1, minor_radius=0.3), "#ff6b6b"),
+            ("Ocean", cached_primitive(Sphere, radius=0.8), "#00b4d8"),
+            ("Cyber", cached_primitive(Icosahedron, edge_length=1.2), "#00ffff"),
+            ("Minimal", cached_primitive(Cube, side_length=1.2), "#3498db"),
+            ("Nature", cached_primitive(Cone, base_radius=0.8, height=1.5), "#4caf50"),
+            ("Cosmic", cached_primitive(Dodecahedron, edge_length=0.8), "#9c27b0"),
         ]
         
         objects = VGroup()
@@ -558,8 +600,8 @@ class All3DStyles(ThreeDScene):
             label.shift(DOWN * 1)
             labels.add(label)
         
-        self.add_fixed_in_frame_mobjects(*labels)
-        self.play(*[FadeIn(l) for l in labels])
+        self.add_fixed_in_frame_mobjects(labels)
+        self.play(FadeIn(labels))
         
         # Rotate all objects
         self.begin_ambient_camera_rotation(rate=0.15)
@@ -572,7 +614,7 @@ class All3DStyles(ThreeDScene):
         # Final message
         self.play(
             FadeOut(objects),
-            *[FadeOut(l) for l in labels]
+            FadeOut(labels)
         )
         
         message = Text(
@@ -0,0 +1,100 @@
+"""
+Shared performance helpers for the Manim examples.
+
+Example scenes live in nested folders and are rendered one file at a time
+(``manim -pqh path/to/scene.py Scene``), so they import this module after
+putting the ``examples/`` directory on ``sys.path``:
+
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+    from perf_helpers import cached_mathtex, vectorized_surface
+
+Examples test ``njit is None`` to pick their pure NumPy kernels when Numba
+is not installed.
+"""
+
+from manim import *
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional; examples fall back to NumPy kernels
+    njit = None
+    prange = range
+
+
+def quality_scale():
+    """Sampling density relative to 1080p output.
+
+    0.5 for previews (-pql), 1 at 1080p and up to 2 at 4K, so previews
+    tessellate far fewer faces.
+    """
+    return min(max(config.pixel_height / 1080, 0.5), 2)
+
+
+# ==============================================================================
+# POINT CLOUDS
+# ==============================================================================
+
+class PointCloud(PMobject):
+    """Many points drawn as one PMobject with per-point RGBA colors.
+
+    Positions are an (N, 3) array and colors an (N, 4) array, so a whole
+    star field or particle system is a single mobject instead of N dots.
+    """
+
+    def __init__(self, positions, rgbas, point_size=3, **kwargs):
+        super().__init__(stroke_width=point_size, **kwargs)
+        self.add_points(np.asarray(positions, dtype=float), rgbas=np.asarray(rgbas, dtype=float))
+
+    def fade(self, darkness=0.5, family=True):
+        # Fading a point cloud scales its per-point alpha, so FadeIn/FadeOut work
+        self.rgbas[:, 3] *= 1 - darkness
+        return super().fade(darkness, family)
+
+
+# ==============================================================================
+# SURFACES
+# ==============================================================================
+
+def vectorized_surface(func_vec, u_range, v_range, resolution, **kwargs):
+    """Build a Surface whose parametrization is evaluated on all points at once.
+
+    ``func_vec(u, v)`` takes coordinate arrays and returns the ``(x, y, z)``
+    arrays, so the formula runs once as NumPy instead of once per vertex
+    through Surface's Python callback.
+    """
+    surface = Surface(
+        lambda u, v: np.array([u, v, 0.0]),
+        u_range=u_range,
+        v_range=v_range,
+        resolution=resolution,
+        **kwargs
+    )
+
+    def warp(points):
+        return np.stack(func_vec(points[:, 0], points[:, 1]), axis=1)
+
+    surface.apply_points_function_about_point(warp, about_point=ORIGIN)
+    return surface
+
+
+# ==============================================================================
+# TEXT
+# ==============================================================================
+
+# Compiled MathTex templates, keyed by source and keyword arguments
+_tex_cache = {}
+
+
+def cached_mathtex(src, **kwargs):
+    """Return a copy of a MathTex, compiling and parsing each formula only once.
+
+    Scenes rendered in the same process (e.g. ``manim -a``) share one LaTeX
+    compile and SVG parse per formula.
+    """
+    key = (src, tuple(sorted(kwargs.items())))
+    tex = _tex_cache.get(key)
+    if tex is None:
+        tex = MathTex(src, **kwargs)
+        _tex_cache[key] = tex
+    return tex.copy()
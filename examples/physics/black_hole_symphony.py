@@ -21,11 +21,17 @@ Author: Generated with Claude Opus 4 for Math-To-Manim
 """
 
 from __future__ import annotations
+from functools import lru_cache
+from pathlib import Path
+import sys
 from manim import *
 import numpy as np
-from random import uniform, seed, choice
 from math import sin, cos, pi, sqrt, exp, atan2
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # examples/, for perf_helpers
+from perf_helpers import PointCloud, cached_mathtex, njit, prange, vectorized_surface
+
+
 # ==============================================================================
 # CONFIGURATION & CONSTANTS
 # ==============================================================================
@@ -56,155 +62,325 @@ HAWKING_ANTIPARTICLE_COLOR = "#3a86ff"
 GRID_COLOR = BLUE_E
 EQUATION_COLOR = WHITE
 
+# Sine lookup table for the small-amplitude periodic terms (disk wobble and
+# jet helix). The power-of-two size lets angles wrap with a bit mask.
+SIN_TABLE_SIZE = 4096
+_SIN_TABLE = np.sin(np.linspace(0, TAU, SIN_TABLE_SIZE, endpoint=False))
+_SIN_TABLE_SCALE = SIN_TABLE_SIZE / TAU
+
+
+def table_sin(angle: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+    """Approximate sin(angle) for an array of angles via the lookup table."""
+    index = (np.asarray(angle) * _SIN_TABLE_SCALE).astype(np.int64) & (SIN_TABLE_SIZE - 1)
+    return np.take(_SIN_TABLE, index, out=out)
+
+
+def table_cos(angle: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+    """Approximate cos(angle) as a quarter-turn shifted table lookup."""
+    index = (np.asarray(angle) * _SIN_TABLE_SCALE).astype(np.int64) + SIN_TABLE_SIZE // 4
+    return np.take(_SIN_TABLE, index & (SIN_TABLE_SIZE - 1), out=out)
+
+
+# Temperature gradient over normalized disk radius: hotter (white-blue) near
+# the center, cooler (red) at the edge. Colors are linear between knots.
+_DISK_COLOR_KNOTS = np.array([0.0, 0.3, 0.6, 1.0])
+_DISK_KNOT_RGB = np.array([
+    color_to_rgb(c) for c in [WHITE, DISK_INNER_COLOR, DISK_MIDDLE_COLOR, DISK_OUTER_COLOR]
+])
+
+
+def disk_temperature_rgb(t: np.ndarray) -> np.ndarray:
+    """Map normalized radii t in [0, 1] to (N, 3) RGB colors without branching."""
+    i = np.clip(np.searchsorted(_DISK_COLOR_KNOTS, t, side="right") - 1, 0, len(_DISK_COLOR_KNOTS) - 2)
+    local = (t - _DISK_COLOR_KNOTS[i]) / (_DISK_COLOR_KNOTS[i + 1] - _DISK_COLOR_KNOTS[i])
+    return _DISK_KNOT_RGB[i] + local[:, None] * (_DISK_KNOT_RGB[i + 1] - _DISK_KNOT_RGB[i])
+
+
+# ==============================================================================
+# PARTICLE KINEMATICS
+# ==============================================================================
+
+def advance_disk_numpy(angle, omega, radius, z_off, dt, out_xyz, scratch):
+    """Advance disk orbits by dt in place and write positions to out_xyz.
+
+    ``scratch`` is an (N,) work buffer, so a frame allocates no temporaries
+    of particle size.
+    """
+    np.multiply(omega, dt, out=scratch)
+    angle += scratch
+    np.cos(angle, out=scratch)
+    np.multiply(radius, scratch, out=out_xyz[:, 0])
+    np.sin(angle, out=scratch)
+    np.multiply(radius, scratch, out=out_xyz[:, 1])
+    # Add slight wobble for realism: z_off * (1 + 0.2 * sin(3 * angle))
+    np.multiply(angle, 3, out=scratch)
+    table_sin(scratch, out=scratch)
+    scratch *= 0.2
+    scratch += 1
+    np.multiply(z_off, scratch, out=out_xyz[:, 2])
+
+
+def advance_jets_numpy(progress, speed, twist, radial_off, z_sign, dt, out_xyz, out_opacity, scratch):
+    """Move jet particles by dt in place, writing positions and opacities.
+
+    ``scratch`` is a (2, N) work buffer; ``out_opacity`` doubles as a third
+    one until the opacities are written last.
+    """
+    jet_radius, angle = scratch
+    np.multiply(speed, dt * 0.1, out=jet_radius)
+    progress += jet_radius
+    reset = progress > 1
+    if reset.any():
+        progress[reset] = 0  # Reset at base
+        twist[reset] = np.random.uniform(0, TAU, reset.sum())
+
+    # Jets extend far: z = z_sign * (0.5 + 8 * progress)
+    np.multiply(progress, 8, out=angle)
+    angle += 0.5
+    np.multiply(z_sign, angle, out=out_xyz[:, 2])
+
+    # Jet widens as it goes; helical motion around the axis
+    np.multiply(progress, 1.5, out=jet_radius)
+    jet_radius += 0.2
+    jet_radius *= radial_off
+    np.multiply(progress, 4 * PI, out=angle)
+    angle += twist
+    np.multiply(jet_radius, table_cos(angle, out=out_opacity), out=out_xyz[:, 0])
+    np.multiply(jet_radius, table_sin(angle, out=out_opacity), out=out_xyz[:, 1])
+
+    # Fade as particle moves away: max(0.1, 0.9 - 0.8 * progress)
+    np.multiply(progress, -0.8, out=out_opacity)
+    out_opacity += 0.9
+    np.maximum(out_opacity, 0.1, out=out_opacity)
+
+
+if njit is not None:
+    # Scalar versions of table_sin/table_cos, so both backends use the same
+    # lookup table for the wobble and helix terms
+    @njit(cache=True)
+    def _table_sin_scalar(angle):
+        return _SIN_TABLE[np.int64(angle * _SIN_TABLE_SCALE) & (SIN_TABLE_SIZE - 1)]
+
+    @njit(cache=True)
+    def _table_cos_scalar(angle):
+        index = np.int64(angle * _SIN_TABLE_SCALE) + SIN_TABLE_SIZE // 4
+        return _SIN_TABLE[index & (SIN_TABLE_SIZE - 1)]
+
+    @njit(parallel=True, cache=True)
+    def advance_disk(angle, omega, radius, z_off, dt, out_xyz, scratch):
+        for i in prange(angle.shape[0]):
+            a = angle[i] + omega[i] * dt
+            angle[i] = a
+            out_xyz[i, 0] = radius[i] * np.cos(a)
+            out_xyz[i, 1] = radius[i] * np.sin(a)
+            out_xyz[i, 2] = z_off[i] * (1.0 + 0.2 * _table_sin_scalar(a * 3.0))
+
+    @njit(parallel=True, cache=True)
+    def advance_jets(progress, speed, twist, radial_off, z_sign, dt, out_xyz, out_opacity, scratch):
+        for i in prange(progress.shape[0]):
+            p = progress[i] + speed[i] * dt * 0.1
+            if p > 1.0:
+                p = 0.0
+                twist[i] = np.random.uniform(0.0, TAU)
+            progress[i] = p
+            out_xyz[i, 2] = z_sign[i] * (0.5 + p * 8.0)
+            jet_radius = (0.2 + p * 1.5) * radial_off[i]
+            a = twist[i] + p * 4.0 * PI
+            out_xyz[i, 0] = jet_radius * _table_cos_scalar(a)
+            out_xyz[i, 1] = jet_radius * _table_sin_scalar(a)
+            out_opacity[i] = max(0.1, 0.9 - 0.8 * p)
+else:
+    advance_disk = advance_disk_numpy
+    advance_jets = advance_jets_numpy
+
 
 # ==============================================================================
 # HELPER CLASSES
 # ==============================================================================
 
-class AccretionParticle:
-    """A particle orbiting in the accretion disk with relativistic effects."""
+class ParticleCloud(PointCloud):
+    """A point cloud whose particles are moved or recolored in place.
+
+    A whole particle system is updated with a single array write instead
+    of N Dot3D mobjects.
+    """
+
+    def set_positions(self, positions: np.ndarray) -> "ParticleCloud":
+        """Overwrite every particle position in place."""
+        self.points[:] = positions
+        return self
+
+    def set_alphas(self, alphas) -> "ParticleCloud":
+        """Overwrite every particle's opacity in place."""
+        self.rgbas[:, 3] = alphas
+        return self
 
-    def __init__(self, radius: float, initial_angle: float,
-                 vertical_scatter: float = 0.1, clockwise: bool = True):
-        self.radius = radius
-        self.angle = initial_angle
-        self.z_offset = uniform(-vertical_scatter, vertical_scatter)
+
+class AccretionDisk:
+    """All accretion disk particles, stored as parallel arrays (SoA).
+
+    Orbital state lives in NumPy arrays of shape (N,) so a frame advances
+    every particle with a handful of vectorized operations instead of a
+    Python call per particle.
+    """
+
+    def __init__(self, radii: np.ndarray, initial_angles: np.ndarray,
+                 vertical_scatter: float = 0.1, clockwise: bool = True,
+                 rng: np.random.Generator | None = None):
+        n = len(radii)
+        rng = rng if rng is not None else np.random.default_rng()
+        self.radius = np.asarray(radii, dtype=float)
+        self.initial_angle = np.asarray(initial_angles, dtype=float)
+        self.angle = self.initial_angle.copy()
+        self.time = 0.0
+        self.z_offset = rng.uniform(-vertical_scatter, vertical_scatter, n)
         self.clockwise = clockwise
 
         # Kepler's third law with relativistic correction near ISCO
         # Angular velocity decreases with radius, increases near black hole
-        base_omega = 1.0 / (radius ** 1.5)
-        relativistic_factor = 1.0 + 0.5 * (ISCO_RADIUS / max(radius, ISCO_RADIUS)) ** 2
+        base_omega = 1.0 / (self.radius ** 1.5)
+        relativistic_factor = 1.0 + 0.5 * (ISCO_RADIUS / np.maximum(self.radius, ISCO_RADIUS)) ** 2
         self.angular_velocity = base_omega * relativistic_factor
         if not clockwise:
             self.angular_velocity *= -1
 
-        # Color based on temperature (hotter closer to center)
-        self.color = self._compute_color(radius)
+        # Color based on temperature (hotter closer to center), as (N, 3) RGB
+        self.colors = self._compute_colors(self.radius)
 
         # Brightness variation
-        self.brightness = uniform(0.6, 1.0)
-
-        # Create the visual representation
-        self.dot = Dot3D(
-            point=self._get_position(),
-            radius=0.015 + 0.01 * (ISCO_RADIUS / radius),
-            color=self.color
-        )
-        self.dot.set_opacity(self.brightness)
-
-    def _compute_color(self, r: float) -> str:
-        """Temperature-based color: hotter (white-blue) near center, cooler (red) at edge."""
+        self.brightness = rng.uniform(0.6, 1.0, n)
+
+        # Create the visual representation: one cloud for the whole disk.
+        # Positions are written into a preallocated (N, 3) buffer each frame.
+        self._xyz = np.empty((n, 3))
+        self._scratch = np.empty(n)
+        self.set_time(0)
+        rgbas = np.column_stack([self.colors, self.brightness])
+        self.cloud = ParticleCloud(self._xyz, rgbas)
+
+    @classmethod
+    def sample(cls, n: int, vertical_scatter: float = 0.1, clockwise: bool = True,
+               seed: int | None = None) -> "AccretionDisk":
+        """Draw n particles at once, with radii following a power law
+        that puts more particles near the ISCO."""
+        rng = np.random.default_rng(seed)
+        radii = ISCO_RADIUS + np.sqrt(rng.uniform(0, 1, n)) * (7 * SCHWARZSCHILD_RADIUS)
+        angles = rng.uniform(0, TAU, n)
+        return cls(radii, angles, vertical_scatter, clockwise, rng=rng)
+
+    @staticmethod
+    def _compute_colors(radii: np.ndarray) -> np.ndarray:
+        """Interpolate each particle's temperature color from its radius."""
         # Normalize radius
-        t = (r - ISCO_RADIUS) / (8 * SCHWARZSCHILD_RADIUS - ISCO_RADIUS)
+        t = (radii - ISCO_RADIUS) / (8 * SCHWARZSCHILD_RADIUS - ISCO_RADIUS)
         t = np.clip(t, 0, 1)
+        return disk_temperature_rgb(t)
 
-        if t < 0.3:
-            return interpolate_color(WHITE, DISK_INNER_COLOR, t / 0.3)
-        elif t < 0.6:
-            return interpolate_color(DISK_INNER_COLOR, DISK_MIDDLE_COLOR, (t - 0.3) / 0.3)
-        else:
-            return interpolate_color(DISK_MIDDLE_COLOR, DISK_OUTER_COLOR, (t - 0.6) / 0.4)
-
-    def _get_position(self) -> np.ndarray:
-        """Calculate 3D position from orbital parameters."""
-        x = self.radius * cos(self.angle)
-        y = self.radius * sin(self.angle)
-        # Add slight wobble for realism
-        z = self.z_offset * (1 + 0.2 * sin(3 * self.angle))
-        return np.array([x, y, z])
-
-    def update(self, dt: float):
-        """Advance particle along its orbit."""
-        self.angle += self.angular_velocity * dt
-        self.dot.move_to(self._get_position())
-
-
-class JetParticle:
-    """A particle in a relativistic jet, moving along magnetic field lines."""
+    def set_time(self, t: float):
+        """Place every particle where its orbit puts it at time t.
 
-    def __init__(self, is_north: bool = True, initial_progress: float = 0.0):
-        self.is_north = is_north
-        self.progress = initial_progress  # 0 to 1 along jet
-        self.radial_offset = uniform(0, 0.3)
-        self.twist_angle = uniform(0, TAU)
-        self.speed = uniform(0.3, 0.6)  # Relativistic but varied
+        Orbits are closed-form in time, so positions are evaluated from the
+        initial angles rather than integrated frame by frame: the only state
+        carried between frames is the clock, and no phase error accumulates.
+        """
+        self.time = t
+        self.angle[:] = self.initial_angle
+        advance_disk(self.angle, self.angular_velocity, self.radius, self.z_offset, t,
+                     self._xyz, self._scratch)
 
-        # Visual
-        self.dot = Dot3D(
-            point=self._get_position(),
-            radius=0.02,
-            color=JET_COLOR
-        )
-        self.dot.set_opacity(uniform(0.5, 0.9))
+    def update(self, dt: float):
+        """Advance every particle along its orbit."""
+        self.set_time(self.time + dt)
+        self.cloud.set_positions(self._xyz)
 
-    def _get_position(self) -> np.ndarray:
-        """Helical path along the jet axis."""
-        z_sign = 1 if self.is_north else -1
-        z = z_sign * (0.5 + self.progress * 8)  # Jets extend far
 
-        # Jet widens as it goes
-        jet_radius = 0.2 + self.progress * 1.5
+class RelativisticJets:
+    """Particles in both relativistic jets, moving along magnetic field lines.
 
-        # Helical motion
-        twist = self.twist_angle + self.progress * 4 * PI
-        x = jet_radius * self.radial_offset * cos(twist)
-        y = jet_radius * self.radial_offset * sin(twist)
+    Like AccretionDisk, per-particle state is kept in (N,) arrays and the
+    particles are drawn as a single point cloud.
+    """
 
-        return np.array([x, y, z])
+    def __init__(self, n_per_jet: int, rng: np.random.Generator | None = None):
+        n = 2 * n_per_jet
+        rng = rng if rng is not None else np.random.default_rng()
+        self.z_sign = np.repeat([1.0, -1.0], n_per_jet)  # North jet, then south
+        self.progress = rng.uniform(0, 1, n)  # 0 to 1 along jet
+        self.radial_offset = rng.uniform(0, 0.3, n)
+        self.twist_angle = rng.uniform(0, TAU, n)
+        self.speed = rng.uniform(0.3, 0.6, n)  # Relativistic but varied
+
+        # Visual; positions and opacities live in preallocated buffers
+        self._xyz = np.empty((n, 3))
+        self._opacity = np.empty(n)
+        self._scratch = np.empty((2, n))
+        self._advance(0)
+        rgbas = np.tile(color_to_rgba(JET_COLOR), (n, 1))
+        rgbas[:, 3] = rng.uniform(0.5, 0.9, n)
+        self.cloud = ParticleCloud(self._xyz, rgbas)
+
+    def _advance(self, dt: float):
+        advance_jets(self.progress, self.speed, self.twist_angle, self.radial_offset,
+                     self.z_sign, dt, self._xyz, self._opacity, self._scratch)
 
     def update(self, dt: float):
-        """Move particle along jet."""
-        self.progress += self.speed * dt * 0.1
-        if self.progress > 1:
-            self.progress = 0  # Reset at base
-            self.twist_angle = uniform(0, TAU)
-        self.dot.move_to(self._get_position())
-        # Fade as particle moves away
-        opacity = max(0.1, 0.9 - 0.8 * self.progress)
-        self.dot.set_opacity(opacity)
+        """Move every particle along its jet."""
+        self._advance(dt)
+        self.cloud.set_positions(self._xyz)
+        self.cloud.set_alphas(self._opacity)
 
 
 # ==============================================================================
 # HELPER FUNCTIONS
 # ==============================================================================
 
-def make_deep_starfield(n: int = STAR_COUNT, radius: float = STAR_SCATTER_RADIUS) -> VGroup:
-    """Create a 3D starfield with depth variation and different star types."""
-    seed(42)
-    stars = VGroup()
-
-    for i in range(n):
-        # Spherical distribution
-        theta = uniform(0, TAU)
-        phi = uniform(0, PI)
-        r = uniform(radius * 0.3, radius)
-
-        x = r * sin(phi) * cos(theta)
-        y = r * sin(phi) * sin(theta)
-        z = r * cos(phi)
-
-        # Star properties based on "distance"
-        distance_factor = r / radius
-        base_radius = 0.01 + 0.04 * (1 - distance_factor)
-
-        # Different star colors (blue giants, yellow dwarfs, red giants)
-        star_colors = [WHITE, BLUE_A, YELLOW_A, ORANGE, RED_A]
-        color = choice(star_colors) if uniform(0, 1) > 0.8 else WHITE
-
-        dot = Dot3D(
-            point=[x, y, z],
-            radius=base_radius * uniform(0.5, 1.5),
-            color=color
-        )
-        dot.set_opacity(uniform(0.3, 1.0) * (1 - distance_factor * 0.5))
-        stars.add(dot)
+def make_deep_starfield(n: int = STAR_COUNT, radius: float = STAR_SCATTER_RADIUS,
+                        seed: int = 42) -> Group:
+    """Create a 3D starfield with depth variation and different star types.
 
+    Every star property is drawn in one vectorized batch, and the field is
+    drawn as a few point clouds (one per star size class) instead of n
+    Dot3D mobjects.
+    """
+    rng = np.random.default_rng(seed)
+
+    # Spherical distribution
+    theta = rng.uniform(0, TAU, n)
+    phi = rng.uniform(0, PI, n)
+    r = rng.uniform(radius * 0.3, radius, n)
+    positions = np.column_stack([
+        r * np.sin(phi) * np.cos(theta),
+        r * np.sin(phi) * np.sin(theta),
+        r * np.cos(phi),
+    ])
+
+    # Star properties based on "distance"
+    distance_factor = r / radius
+    base_radius = 0.01 + 0.04 * (1 - distance_factor)
+    star_radius = base_radius * rng.uniform(0.5, 1.5, n)
+
+    # Different star colors (blue giants, yellow dwarfs, red giants)
+    star_colors = np.array([color_to_rgb(c) for c in [WHITE, BLUE_A, YELLOW_A, ORANGE, RED_A]])
+    tinted = rng.uniform(0, 1, n) > 0.8
+    color_index = np.where(tinted, rng.integers(0, len(star_colors), n), 0)
+    rgbas = np.empty((n, 4))
+    rgbas[:, :3] = star_colors[color_index]
+    rgbas[:, 3] = rng.uniform(0.3, 1.0, n) * (1 - distance_factor * 0.5)
+
+    # Point clouds share one size, so bin stars into small/medium/large
+    size_class = np.digitize(star_radius, [0.02, 0.04])
+
+    # Assemble one point cloud per size class
+    stars = Group()
+    for k, point_size in enumerate([1.5, 3, 4.5]):
+        in_class = size_class == k
+        if in_class.any():
+            stars.add(ParticleCloud(positions[in_class], rgbas[in_class], point_size=point_size))
     return stars
 
 
-def create_event_horizon() -> VGroup:
-    """Create the black hole's event horizon as a perfect black sphere."""
+@lru_cache(maxsize=None)
+def _event_horizon_template() -> VGroup:
     horizon = Sphere(
         radius=SCHWARZSCHILD_RADIUS,
         resolution=(32, 32)
@@ -213,37 +389,44 @@ def create_event_horizon() -> VGroup:
     horizon.set_opacity(1.0)
     horizon.set_shade_in_3d(True)
 
-    # Add subtle glow rim
-    glow = Sphere(
-        radius=SCHWARZSCHILD_RADIUS * 1.02,
-        resolution=(16, 16)
+    # Add subtle glow rim: a flat annulus, meant to be registered with
+    # add_fixed_orientation_mobjects so it always faces the camera like a
+    # billboard, instead of a second tessellated sphere
+    glow = Annulus(
+        inner_radius=SCHWARZSCHILD_RADIUS,
+        outer_radius=SCHWARZSCHILD_RADIUS * 1.08,
+        color=LENSING_COLOR,
+        fill_opacity=0.1,
+        stroke_width=0
     )
-    glow.set_color(LENSING_COLOR)
-    glow.set_opacity(0.1)
 
     return VGroup(horizon, glow)
 
 
-def create_ergosphere() -> Surface:
-    """Create the ergosphere - the region where spacetime is dragged."""
-    def ergosphere_func(u, v):
-        # Ergosphere radius varies with latitude (polar angle)
-        # r_ergo = r_s * (1 + sqrt(1 - a^2 * cos^2(theta))) for Kerr
-        # Simplified: larger at equator, touches horizon at poles
-        theta = v  # polar angle
-        phi = u    # azimuthal angle
+def create_event_horizon() -> VGroup:
+    """Create the black hole's event horizon as a perfect black sphere.
 
-        # Ergosphere shape
-        equatorial_factor = abs(sin(theta))
-        r = SCHWARZSCHILD_RADIUS * (1 + 0.5 * equatorial_factor)
+    Returns VGroup(horizon, glow); scenes should pass the glow to
+    add_fixed_orientation_mobjects. The sphere is tessellated once per
+    process; each call returns a copy.
+    """
+    return _event_horizon_template().copy()
 
-        x = r * sin(theta) * cos(phi)
-        y = r * sin(theta) * sin(phi)
-        z = r * cos(theta)
 
-        return np.array([x, y, z])
+@lru_cache(maxsize=None)
+def _ergosphere_template() -> Surface:
+    def ergosphere_func(phi, theta):
+        # Ergosphere radius varies with latitude (polar angle)
+        # r_ergo = r_s * (1 + sqrt(1 - a^2 * cos^2(theta))) for Kerr
+        # Simplified: larger at equator, touches horizon at poles
+        r = SCHWARZSCHILD_RADIUS * (1 + 0.5 * np.abs(np.sin(theta)))
+        return (
+            r * np.sin(theta) * np.cos(phi),
+            r * np.sin(theta) * np.sin(phi),
+            r * np.cos(theta),
+        )
 
-    ergosphere = Surface(
+    ergosphere = vectorized_surface(
         ergosphere_func,
         u_range=[0, TAU],
         v_range=[0, PI],
@@ -259,6 +442,15 @@ def create_ergosphere() -> Surface:
     return ergosphere
 
 
+def create_ergosphere() -> Surface:
+    """Create the ergosphere - the region where spacetime is dragged.
+
+    The mesh is evaluated in one vectorized pass and cached; each call
+    returns a copy.
+    """
+    return _ergosphere_template().copy()
+
+
 def create_photon_sphere() -> VMobject:
     """Create the photon sphere where light orbits the black hole."""
     # Draw as a thin ring at the equator to indicate the photon sphere
@@ -268,7 +460,8 @@ def create_photon_sphere() -> VMobject:
             PHOTON_SPHERE * sin(t),
             0
         ]),
-        t_range=[0, TAU],
+        t_range=[0, TAU, TAU / 64],  # Dense enough for straight segments
+        use_smoothing=False,
         color=YELLOW_A,
         stroke_width=2
     )
@@ -277,46 +470,43 @@ def create_photon_sphere() -> VMobject:
     return photon_ring
 
 
-def create_spacetime_grid(time_val: float = 0) -> VGroup:
-    """Create a 2D grid that shows spacetime curvature around the black hole."""
-    grid_lines = VGroup()
+def _grid_points(radii: np.ndarray, angles: np.ndarray) -> np.ndarray:
+    """Evaluate the warped grid on a (radius, angle) mesh -> (R, A, 3)."""
+    R, A = np.meshgrid(radii, angles, indexing="ij")
+    points = np.empty(R.shape + (3,))
+    points[..., 0] = R * np.cos(A)
+    points[..., 1] = R * np.sin(A)
+    # Warp the z-coordinate based on distance (gravitational well), shifted
+    # down. It depends on radius only, so evaluate it once per radius.
+    z_warp = -2 * SCHWARZSCHILD_RADIUS / np.maximum(radii, SCHWARZSCHILD_RADIUS * 1.1) - 3
+    points[..., 2] = z_warp[:, None]
+    return points
 
-    # Radial lines
-    for angle in np.linspace(0, TAU, 24, endpoint=False):
-        points = []
-        for r in np.linspace(SCHWARZSCHILD_RADIUS * 1.5, 12, 50):
-            # Gravitational time dilation factor
-            dilation = sqrt(1 - SCHWARZSCHILD_RADIUS / r) if r > SCHWARZSCHILD_RADIUS else 0.1
 
-            # Warp the z-coordinate based on distance (gravitational well)
-            z_warp = -2 * SCHWARZSCHILD_RADIUS / max(r, SCHWARZSCHILD_RADIUS * 1.1)
+def create_spacetime_grid() -> VGroup:
+    """Create a 2D grid that shows spacetime curvature around the black hole."""
+    # Radial lines: one row of samples per angle
+    radial = _grid_points(
+        np.linspace(SCHWARZSCHILD_RADIUS * 1.5, 12, 50),
+        np.linspace(0, TAU, 24, endpoint=False),
+    ).transpose(1, 0, 2)
 
-            x = r * cos(angle)
-            y = r * sin(angle)
-            z = z_warp - 3  # Shift down
+    # Circular lines: one row of samples per radius
+    rings = _grid_points(np.linspace(2, 12, 8), np.linspace(0, TAU, 64))
+    rings = np.concatenate([rings, rings[:, :1]], axis=1)  # Close the loop
 
-            points.append([x, y, z])
+    grid_lines = VGroup()
 
+    # Samples are dense, so piecewise-linear curves look the same as fitted ones
+    for points in radial:
         line = VMobject()
-        line.set_points_smoothly(points)
+        line.set_points_as_corners(points)
         line.set_stroke(GRID_COLOR, width=1, opacity=0.4)
         grid_lines.add(line)
 
-    # Circular lines
-    for r in np.linspace(2, 12, 8):
-        points = []
-        for angle in np.linspace(0, TAU, 64):
-            z_warp = -2 * SCHWARZSCHILD_RADIUS / max(r, SCHWARZSCHILD_RADIUS * 1.1)
-
-            x = r * cos(angle)
-            y = r * sin(angle)
-            z = z_warp - 3
-
-            points.append([x, y, z])
-        points.append(points[0])  # Close the loop
-
+    for points in rings:
         circle = VMobject()
-        circle.set_points_smoothly(points)
+        circle.set_points_as_corners(points)
         circle.set_stroke(GRID_COLOR, width=1, opacity=0.3)
         grid_lines.add(circle)
 
@@ -327,42 +517,34 @@ def create_lensing_ring() -> VGroup:
     """Create the Einstein ring / gravitational lensing effect."""
     rings = VGroup()
 
+    # The rings differ only in radius, so sample the unit ring once and scale
+    t = np.linspace(0, TAU, 65)
+    base = np.column_stack([np.cos(t), np.sin(t), 0.1 * np.sin(4 * t)])  # Slight wobble
+
     # Multiple concentric rings representing lensed light
     for i, r in enumerate([2.2, 2.5, 2.8]):
-        ring = ParametricFunction(
-            lambda t, r=r: np.array([
-                r * cos(t),
-                r * sin(t),
-                0.1 * sin(4 * t)  # Slight wobble
-            ]),
-            t_range=[0, TAU],
-            color=LENSING_COLOR,
-            stroke_width=3 - i
-        )
+        ring = VMobject()
+        ring.set_points_as_corners(base * np.array([r, r, 1.0]))
+        ring.set_stroke(LENSING_COLOR, width=3 - i)
         ring.set_opacity(0.7 - i * 0.2)
         rings.add(ring)
 
     return rings
 
 
-def create_accretion_disk_base() -> Surface:
-    """Create the base accretion disk surface with color gradient."""
-    def disk_func(u, v):
-        # u: angle (0 to 2pi)
-        # v: radius (ISCO to outer edge)
-        r = v
-        theta = u
+@lru_cache(maxsize=None)
+def _accretion_disk_base_template() -> Surface:
+    def disk_func(theta, r):
+        # theta: angle (0 to 2pi)
+        # r: radius (ISCO to outer edge)
 
         # Slight vertical structure (thicker at edge, thin at center)
-        thickness = 0.05 * (r / 8) ** 0.5
-        z = thickness * sin(theta * 3)  # Warps
-
-        x = r * cos(theta)
-        y = r * sin(theta)
+        thickness = 0.05 * np.sqrt(r / 8)
+        z = thickness * np.sin(theta * 3)  # Warps
 
-        return np.array([x, y, z])
+        return r * np.cos(theta), r * np.sin(theta), z
 
-    disk = Surface(
+    disk = vectorized_surface(
         disk_func,
         u_range=[0, TAU],
         v_range=[ISCO_RADIUS, 8 * SCHWARZSCHILD_RADIUS],
@@ -386,6 +568,121 @@ def create_accretion_disk_base() -> Surface:
     return disk
 
 
+def create_accretion_disk_base() -> Surface:
+    """Create the base accretion disk surface with color gradient.
+
+    The mesh is evaluated in one vectorized pass and cached; each call
+    returns a copy.
+    """
+    return _accretion_disk_base_template().copy()
+
+
+# ==============================================================================
+# GEODESICS
+# ==============================================================================
+
+def _integrate_null_orbit(u0, w0, dphi, n_max, u_escape, u_horizon):
+    """RK4-integrate an equatorial light ray in Schwarzschild spacetime.
+
+    With u = 1/r, the null geodesic equation reduces to the orbit equation
+    u'' = -u + (3/2) r_s u^2 (primes are d/dphi). Starting from u0 and
+    w0 = du/dphi, steps until the ray falls through u_horizon, heads back
+    out past u_escape, or n_max samples have been taken. Returns u per step.
+    """
+    us = np.empty(n_max)
+    u = u0
+    w = w0
+    k = 1.5 * SCHWARZSCHILD_RADIUS
+    n = 0
+    while n < n_max:
+        us[n] = u
+        n += 1
+        if u >= u_horizon or (u <= u_escape and w < 0):
+            break
+        a1 = w
+        b1 = -u + k * u * u
+        u2 = u + 0.5 * dphi * a1
+        a2 = w + 0.5 * dphi * b1
+        b2 = -u2 + k * u2 * u2
+        u3 = u + 0.5 * dphi * a2
+        a3 = w + 0.5 * dphi * b2
+        b3 = -u3 + k * u3 * u3
+        u4 = u + dphi * a3
+        a4 = w + dphi * b3
+        b4 = -u4 + k * u4 * u4
+        u += dphi / 6 * (a1 + 2 * a2 + 2 * a3 + a4)
+        w += dphi / 6 * (b1 + 2 * b2 + 2 * b3 + b4)
+    return us[:n]
+
+
+integrate_null_orbit = (
+    njit(cache=True)(_integrate_null_orbit) if njit is not None else _integrate_null_orbit
+)
+
+# Part of every geodesic cache key; bump it whenever the integrator, its
+# termination test or the curve sampling changes, so stale files are not reused
+GEODESIC_CACHE_VERSION = 1
+
+
+def geodesic_cache_dir() -> Path:
+    """Directory for memoized geodesics, resolved at call time so CLI flags
+    such as --media_dir are already applied to the config."""
+    return Path(config.media_dir) / "geodesic_cache"
+
+
+@lru_cache(maxsize=None)
+def _null_geodesic_data(r0: float, impact: float | None, dphi: float,
+                        n_max: int, n_samples: int) -> dict[str, np.ndarray]:
+    impact_key = "none" if impact is None else f"{impact:.6f}"
+    key = (f"v{GEODESIC_CACHE_VERSION:d}_r{r0:.6f}_b{impact_key}_d{dphi:.6f}"
+           f"_n{n_max:d}_s{n_samples:d}_rs{SCHWARZSCHILD_RADIUS:.6f}")
+    cache_dir = geodesic_cache_dir()
+    cache_file = cache_dir / f"null_{key}.npz"
+    if cache_file.exists():
+        with np.load(cache_file) as cached:
+            return {"points": cached["points"], "bezier": cached["bezier"]}
+
+    u0 = 1 / r0
+    if impact is None:
+        w0, n_steps = 0.0, int(round(TAU / dphi)) + 1
+    else:
+        # (du/dphi)^2 = 1/b^2 - u^2 (1 - r_s u); positive root heads inward
+        w0 = sqrt(max(1 / impact ** 2 - u0 ** 2 * (1 - SCHWARZSCHILD_RADIUS * u0), 0.0))
+        n_steps = n_max
+    u = integrate_null_orbit(u0, w0, dphi, n_steps, u0, 1 / SCHWARZSCHILD_RADIUS)
+    u = np.minimum(u, 1 / SCHWARZSCHILD_RADIUS)  # Stop at the horizon
+    phi = dphi * np.arange(len(u))
+    if impact is not None and u[-1] < 1 / SCHWARZSCHILD_RADIUS:
+        phi -= phi[np.argmax(u)]  # Closest approach on the +x axis
+
+    pick = np.linspace(0, len(u) - 1, n_samples).round().astype(int)
+    r = 1 / u[pick]
+    points = np.column_stack([r * np.cos(phi[pick]), r * np.sin(phi[pick]), np.zeros(n_samples)])
+    # Fit the smooth Bezier curve once too, so renders skip the spline solve
+    bezier = VMobject().set_points_smoothly(points).points
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    np.savez(cache_file, points=points, bezier=bezier)
+    return {"points": points, "bezier": bezier}
+
+
+def null_geodesic_curve(r0: float, impact: float | None = None, **kwargs) -> VMobject:
+    """A smooth VMobject along a light ray, integrated once ever.
+
+    The ray starts at radius r0 heading inward with impact parameter
+    ``impact``; with ``impact=None`` it starts tangentially and runs for one
+    revolution (the photon-sphere orbit when r0 = PHOTON_SPHERE). Scattered
+    rays are rotated so their closest approach lies on the +x axis.
+    The samples and their fitted Bezier control points are memoized as .npz
+    files under the media directory, so building the curve is a plain
+    point-buffer assignment after the first render.
+    """
+    params = dict(dphi=0.002, n_max=20000, n_samples=100) | kwargs
+    curve = VMobject()
+    curve.set_points(_null_geodesic_data(r0, impact, **params)["bezier"].copy())
+    return curve
+
+
 # ==============================================================================
 # MAIN SCENE
 # ==============================================================================
@@ -495,6 +792,7 @@ class BlackHoleSymphony(ThreeDScene):
         # Event horizon emerges from darkness
         event_horizon = create_event_horizon()
         event_horizon.scale(0.01)
+        self.add_fixed_orientation_mobjects(event_horizon[1])  # Glow faces the camera
 
         self.play(
             event_horizon.animate.scale(100),  # Scale up from tiny
@@ -506,7 +804,7 @@ class BlackHoleSymphony(ThreeDScene):
         rotation_tracker = ValueTracker(0)
 
         # Schwarzschild metric equation
-        metric_eq = MathTex(
+        metric_eq = cached_mathtex(
             r"ds^2 = -\left(1 - \frac{r_s}{r}\right)c^2 dt^2 + "
             r"\frac{dr^2}{1 - \frac{r_s}{r}} + r^2 d\Omega^2",
             font_size=32,
@@ -536,7 +834,7 @@ class BlackHoleSymphony(ThreeDScene):
         )
 
         # Kerr metric annotation
-        kerr_note = MathTex(
+        kerr_note = cached_mathtex(
             r"\text{Kerr: } g_{t\phi} \neq 0 \implies \text{Frame Dragging}",
             font_size=28,
             color=PURPLE_A
@@ -578,16 +876,10 @@ class BlackHoleSymphony(ThreeDScene):
         )
 
         # Create particle system
-        seed(123)
-        disk_particles = []
-        for _ in range(DISK_PARTICLE_COUNT):
-            # Power-law distribution: more particles near ISCO
-            r = ISCO_RADIUS + (uniform(0, 1) ** 0.5) * (7 * SCHWARZSCHILD_RADIUS)
-            angle = uniform(0, TAU)
-            particle = AccretionParticle(r, angle, vertical_scatter=0.15)
-            disk_particles.append(particle)
+        rng = np.random.default_rng(123)
+        disk = AccretionDisk.sample(DISK_PARTICLE_COUNT, vertical_scatter=0.15, seed=123)
 
-        particle_dots = VGroup(*[p.dot for p in disk_particles])
+        particle_dots = disk.cloud
 
         # Gravitational lensing rings
         lensing = create_lensing_ring()
@@ -600,8 +892,7 @@ class BlackHoleSymphony(ThreeDScene):
 
         # Add disk dynamics updater
         def update_disk(mob, dt):
-            for p in disk_particles:
-                p.update(dt)
+            disk.update(dt)
 
         particle_dots.add_updater(update_disk)
 
@@ -623,15 +914,8 @@ class BlackHoleSymphony(ThreeDScene):
         )
 
         # Create jet particles
-        jet_particles_north = [JetParticle(is_north=True, initial_progress=uniform(0, 1))
-                               for _ in range(JET_PARTICLE_COUNT // 2)]
-        jet_particles_south = [JetParticle(is_north=False, initial_progress=uniform(0, 1))
-                               for _ in range(JET_PARTICLE_COUNT // 2)]
-
-        jet_dots = VGroup(
-            *[p.dot for p in jet_particles_north],
-            *[p.dot for p in jet_particles_south]
-        )
+        jets = RelativisticJets(JET_PARTICLE_COUNT // 2, rng=rng)
+        jet_dots = jets.cloud
 
         # Jet axis indicator
         jet_axis = Line3D(
@@ -650,13 +934,12 @@ class BlackHoleSymphony(ThreeDScene):
 
         # Jet dynamics
         def update_jets(mob, dt):
-            for p in jet_particles_north + jet_particles_south:
-                p.update(dt)
+            jets.update(dt)
 
         jet_dots.add_updater(update_jets)
 
         # Jet equation
-        jet_eq = MathTex(
+        jet_eq = cached_mathtex(
             r"P_{\text{jet}} \sim \dot{M} c^2 \cdot \epsilon_{\text{BZ}}",
             font_size=28,
             color=JET_COLOR
@@ -669,7 +952,7 @@ class BlackHoleSymphony(ThreeDScene):
         # PHASE 7: HAWKING RADIATION (Quantum Effects)
         # =====================================================================
 
-        hawking_note = MathTex(
+        hawking_note = cached_mathtex(
             r"T_H = \frac{\hbar c^3}{8\pi G M k_B}",
             font_size=28,
             color=HAWKING_PARTICLE_COLOR
@@ -678,43 +961,35 @@ class BlackHoleSymphony(ThreeDScene):
         self.add_fixed_in_frame_mobjects(hawking_note)
         self.play(Write(hawking_note), run_time=2)
 
-        # Create Hawking pair animations
-        hawking_pairs = VGroup()
-        for i in range(8):
-            angle = i * TAU / 8
-            r = SCHWARZSCHILD_RADIUS * 1.3
-
-            # Particle escapes
-            particle = Dot3D(
-                point=[r * cos(angle), r * sin(angle), 0],
-                radius=0.03,
-                color=HAWKING_PARTICLE_COLOR
-            )
-            # Antiparticle falls in
-            antiparticle = Dot3D(
-                point=[r * cos(angle), r * sin(angle), 0],
-                radius=0.03,
-                color=HAWKING_ANTIPARTICLE_COLOR
-            )
-            hawking_pairs.add(particle, antiparticle)
+        # Create Hawking pairs: particles and antiparticles as two 8-point clouds
+        pair_angles = np.arange(8) * TAU / 8
+        ring = np.column_stack([np.cos(pair_angles), np.sin(pair_angles), np.zeros(8)])
+        pair_start = ring * SCHWARZSCHILD_RADIUS * 1.3
+
+        # Particle escapes
+        particles = ParticleCloud(
+            pair_start, np.tile(color_to_rgba(HAWKING_PARTICLE_COLOR), (8, 1)), point_size=5
+        )
+        # Antiparticle falls in
+        antiparticles = ParticleCloud(
+            pair_start, np.tile(color_to_rgba(HAWKING_ANTIPARTICLE_COLOR), (8, 1)), point_size=5
+        )
+        hawking_pairs = Group(particles, antiparticles)
 
         self.play(FadeIn(hawking_pairs))
 
-        # Animate pair separation
-        particle_anims = []
-        for i in range(0, len(hawking_pairs), 2):
-            angle = (i // 2) * TAU / 8
-            # Particle escapes outward
-            escape_point = np.array([5 * cos(angle), 5 * sin(angle), uniform(-1, 1)])
-            particle_anims.append(
-                hawking_pairs[i].animate.move_to(escape_point).set_opacity(0)
-            )
-            # Antiparticle falls to horizon
-            particle_anims.append(
-                hawking_pairs[i+1].animate.move_to(ORIGIN).set_opacity(0)
-            )
-
-        self.play(*particle_anims, run_time=4, rate_func=smooth)
+        # Animate pair separation: particles escape outward, antiparticles
+        # fall to the horizon, both fading; one animation drives all 16
+        escape_points = ring * 5
+        escape_points[:, 2] = rng.uniform(-1, 1, 8)
+
+        def separate_pairs(mob, alpha):
+            particles.set_positions(pair_start + alpha * (escape_points - pair_start))
+            antiparticles.set_positions((1 - alpha) * pair_start)
+            particles.set_alphas(1 - alpha)
+            antiparticles.set_alphas(1 - alpha)
+
+        self.play(UpdateFromAlphaFunc(hawking_pairs, separate_pairs), run_time=4, rate_func=smooth)
 
         # =====================================================================
         # PHASE 8: GRAND FINALE - FULL COSMIC VIEW
@@ -794,6 +1069,7 @@ class GeodesicVisualization(ThreeDScene):
         # Create black hole
         horizon = create_event_horizon()
         stars = make_deep_starfield(n=500, radius=30)
+        self.add_fixed_orientation_mobjects(horizon[1])  # Glow faces the camera
 
         self.add(stars)
         self.play(FadeIn(horizon), run_time=2)
@@ -806,7 +1082,7 @@ class GeodesicVisualization(ThreeDScene):
         self.play(Write(title))
 
         # Geodesic equation
-        geodesic_eq = MathTex(
+        geodesic_eq = cached_mathtex(
             r"\frac{d^2 x^\mu}{d\tau^2} + \Gamma^\mu_{\alpha\beta}"
             r"\frac{dx^\alpha}{d\tau}\frac{dx^\beta}{d\tau} = 0",
             font_size=32
@@ -818,42 +1094,19 @@ class GeodesicVisualization(ThreeDScene):
         # Create various geodesics
         geodesics = VGroup()
 
+        # Light rays integrated from the Schwarzschild geodesic equation
+        # (cached on disk after the first render)
+
         # 1. Circular orbit (at photon sphere)
-        circular = ParametricFunction(
-            lambda t: np.array([
-                PHOTON_SPHERE * cos(t),
-                PHOTON_SPHERE * sin(t),
-                0
-            ]),
-            t_range=[0, TAU],
-            color=YELLOW,
-            stroke_width=3
-        )
+        circular = null_geodesic_curve(PHOTON_SPHERE)
+        circular.set_stroke(YELLOW, width=3)
 
-        # 2. Plunging orbit
-        plunge_points = []
-        for i in range(100):
-            t = i / 99
-            r = 5 - 4 * t  # Starts at r=5, ends at r=1
-            angle = t * 3 * PI  # Spirals in
-            if r > SCHWARZSCHILD_RADIUS:
-                plunge_points.append([r * cos(angle), r * sin(angle), 0])
-
-        plunging = VMobject()
-        plunging.set_points_smoothly(plunge_points)
+        # 2. Plunging orbit: impact parameter below the critical 3*sqrt(3)/2 r_s
+        plunging = null_geodesic_curve(5.0, impact=2.3)
         plunging.set_stroke(RED, width=3)
 
         # 3. Scattered geodesic (comes close, escapes)
-        scatter_points = []
-        for i in range(100):
-            t = (i - 50) / 25  # -2 to 2
-            # Hyperbolic-like path
-            r = 2 + sqrt(1 + t ** 2)
-            angle = 0.5 * np.arctan(t)
-            scatter_points.append([r * cos(angle), r * sin(angle), 0])
-
-        scattered = VMobject()
-        scattered.set_points_smoothly(scatter_points)
+        scattered = null_geodesic_curve(6.0, impact=3.2)
         scattered.set_stroke(GREEN, width=3)
 
         # Animate geodesics
@@ -873,13 +1126,13 @@ class GeodesicVisualization(ThreeDScene):
         self.add_fixed_in_frame_mobjects(labels)
         self.play(FadeIn(labels))
 
-        # Camera rotation
-        self.begin_ambient_camera_rotation(rate=0.1)
-        self.wait(6)
-        self.stop_ambient_camera_rotation()
+        # Camera rotation: the curves are static, so sweep theta in a single
+        # linear camera move (0.1 rad/s for 6 s) rather than running the
+        # ambient-rotation updater through a wait
+        self.move_camera(theta=self.camera.get_theta() + 0.6, run_time=6, rate_func=linear)
 
         # Fade out
-        self.play(*[FadeOut(mob) for mob in self.mobjects], run_time=3)
+        self.play(FadeOut(Group(*self.mobjects)), run_time=3)
 
 
 class TimeDilationVisualization(ThreeDScene):
@@ -900,6 +1153,7 @@ class TimeDilationVisualization(ThreeDScene):
         # Black hole
         horizon = create_event_horizon()
         stars = make_deep_starfield(n=800, radius=40)
+        self.add_fixed_orientation_mobjects(horizon[1])  # Glow faces the camera
 
         self.add(stars)
         self.play(FadeIn(horizon), run_time=2)
@@ -912,7 +1166,7 @@ class TimeDilationVisualization(ThreeDScene):
         self.play(Write(title))
 
         # Time dilation formula
-        dilation_eq = MathTex(
+        dilation_eq = cached_mathtex(
             r"\frac{d\tau}{dt} = \sqrt{1 - \frac{r_s}{r}}",
             font_size=36
         )
@@ -942,20 +1196,26 @@ class TimeDilationVisualization(ThreeDScene):
         # Time tracker
         time_tracker = ValueTracker(0)
 
-        # Update clock hands based on time dilation
+        # Update clock hands based on time dilation. The dilation factor and
+        # clock centers are fixed, so precompute them and evaluate every hand
+        # angle in one vectorized step per frame
+        hands = [hand for hand, _ in clock_hands]
+        hand_radii = np.array([r for _, r in clock_hands], dtype=float)
+        dilation = np.sqrt(1 - SCHWARZSCHILD_RADIUS / hand_radii)
+        # Preallocated (hand, corner, xyz) buffer: centers are written once,
+        # tips are overwritten in place every frame
+        hand_corners = np.zeros((len(hands), 2, 3))
+        hand_corners[:, 0, 0] = hand_radii
+        angle = np.empty(len(hands))
+
         def update_clocks(mob, dt):
-            t = time_tracker.get_value()
-            for hand, r in clock_hands:
-                # Time dilation factor
-                dilation = sqrt(1 - SCHWARZSCHILD_RADIUS / r)
-                local_time = t * dilation
-                angle = -local_time * 2 * PI  # One rotation per unit time
-
-                center = np.array([r, 0, 0])
-                hand.put_start_and_end_on(
-                    center,
-                    center + 0.25 * np.array([sin(angle), cos(angle), 0])
-                )
+            np.multiply(dilation, -time_tracker.get_value() * 2 * PI, out=angle)  # One rotation per unit time
+            np.sin(angle, out=hand_corners[:, 1, 0])
+            np.cos(angle, out=hand_corners[:, 1, 1])
+            hand_corners[:, 1, :2] *= 0.25
+            hand_corners[:, 1, 0] += hand_radii
+            for hand, corners in zip(hands, hand_corners):
+                hand.set_points_as_corners(corners)
 
         clocks.add_updater(update_clocks)
 
@@ -978,7 +1238,7 @@ class TimeDilationVisualization(ThreeDScene):
         self.wait(2)
 
         # Fade out
-        self.play(*[FadeOut(mob) for mob in self.mobjects], run_time=3)
+        self.play(FadeOut(Group(*self.mobjects)), run_time=3)
 
 
 # ==============================================================================
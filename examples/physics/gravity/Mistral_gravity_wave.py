@@ -1,6 +1,92 @@
+from pathlib import Path
+import sys
+
 from manim import *
+import math
 import numpy as np
-import random
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # examples/, for perf_helpers
+from perf_helpers import njit, prange, quality_scale
+
+
+WARP_BLOCK = 4096  # Points per tile, so the wave temporaries stay in cache
+
+def warp_spacetime(points, t, r):
+    # Displace (N, 3) grid points in place by the multi-frequency wave,
+    # one cache-sized tile at a time
+    resonance = 0.1*r**2 * math.sin(2*t)  # Scalar time factor: math, not np
+    for start in range(0, len(points), WARP_BLOCK):
+        tile = points[start:start + WARP_BLOCK]
+        d = np.hypot(tile[:, 0], tile[:, 1])
+
+        # Base wave
+        phase1 = 3*t - 0.7*d
+        amp1 = 0.3/(d+0.5)
+
+        # Harmonic component
+        phase2 = 5*t - 1.2*d
+        amp2 = 0.15*r/(d+1)
+
+        # Nonlinear resonance
+        dx3 = resonance * np.exp(-d/4)
+
+        tile[:, 0] += amp1*np.cos(phase1) + amp2*np.cos(phase2) + dx3
+        tile[:, 1] += amp1*np.sin(phase1) + amp2*np.sin(phase2)
+
+
+def warp_from_rest_numpy(rest, out, t, r):
+    np.copyto(out, rest)
+    warp_spacetime(out, t, r)
+
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def warp_from_rest(rest, out, t, r):
+        # Same wave as warp_spacetime, evaluated independently per vertex
+        # from the rest mesh, so every core gets its own slice of points
+        resonance = 0.1*r*r * math.sin(2*t)
+        for i in prange(rest.shape[0]):
+            x = rest[i, 0]
+            y = rest[i, 1]
+            d = math.sqrt(x*x + y*y)
+            phase1 = 3*t - 0.7*d
+            amp1 = 0.3/(d+0.5)
+            phase2 = 5*t - 1.2*d
+            amp2 = 0.15*r/(d+1)
+            out[i, 0] = x + amp1*math.cos(phase1) + amp2*math.cos(phase2) + resonance*math.exp(-d/4)
+            out[i, 1] = y + amp1*math.sin(phase1) + amp2*math.sin(phase2)
+            out[i, 2] = rest[i, 2]
+else:
+    warp_from_rest = warp_from_rest_numpy
+
+
+def mollweide_mesh_numpy(u, v, out_xy, out_weight):
+    # Project (u, v) mesh samples to Mollweide (x, y) and evaluate the
+    # probability contour's Gaussian height weight, in one pass
+    u = np.clip(u, -PI, PI)
+    v = np.clip(v, -PI/2, PI/2)
+    phi = np.arcsin(np.clip((2*v + np.sin(2*v)) / np.pi, -1, 1))
+    out_xy[:, 0] = 2 * np.sqrt(2) * (u - np.pi) * np.cos(phi) / np.pi
+    out_xy[:, 1] = np.sqrt(2) * np.sin(phi)
+    out_weight[:] = 0.05*np.exp(-((u-0.3)**2 + (v-0.2)**2)/0.5)
+
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def mollweide_mesh(u, v, out_xy, out_weight):
+        for i in prange(u.shape[0]):
+            ui = min(max(u[i], -math.pi), math.pi)
+            vi = min(max(v[i], -math.pi/2), math.pi/2)
+            arg = min(max((2*vi + math.sin(2*vi)) / math.pi, -1.0), 1.0)
+            phi = math.asin(arg)
+            out_xy[i, 0] = 2 * math.sqrt(2.0) * (ui - math.pi) * math.cos(phi) / math.pi
+            out_xy[i, 1] = math.sqrt(2.0) * math.sin(phi)
+            du = ui - 0.3
+            dv = vi - 0.2
+            out_weight[i] = 0.05*math.exp(-(du*du + dv*dv)/0.5)
+else:
+    mollweide_mesh = mollweide_mesh_numpy
+
 
 class GravitationalWaveSymphony(ThreeDScene):
     def construct(self):
@@ -11,26 +97,50 @@ class GravitationalWaveSymphony(ThreeDScene):
         # ======================
         # Section 1: Cosmic Overture (0:00-0:30)
         # ======================
-        # Starfield with varying brightness and twinkling effect
-        stars = VGroup(*[
-            Dot(radius=0.002*(1+np.random.rand()**3),
-                color=interpolate_color(WHITE, BLUE_E, random.random()))
-            .shift(15*(np.random.rand(3)-0.5))
-            for _ in range(1000)
-        ])
+        # Starfield with varying brightness and twinkling effect, drawn as a
+        # single point cloud with per-star colors instead of 1000 Dots
+        quality = quality_scale()
+        num_stars = int(1000*min(quality, 1))
+        star_positions = 15*(np.random.rand(num_stars, 3)-0.5)
+        star_tint = np.random.rand(num_stars, 1)
+        star_rgbas = np.ones((num_stars, 4))
+        star_rgbas[:, :3] = (1-star_tint)*color_to_rgb(WHITE) + star_tint*color_to_rgb(BLUE_E)
+        stars = PMobject(stroke_width=1)
+        stars.add_points(star_positions, rgbas=star_rgbas)
+
+        # Add twinkling effect: one updater for the whole field, each star
+        # offset by its own random phase along a shared clock
+        star_phases = TAU*np.random.rand(num_stars)
+        star_reveal = np.zeros(num_stars)  # Per-star fade-in progress
+        stars.clock = 0.0
+
+        def set_star_opacity(group):
+            group.rgbas[:, 3] = star_reveal * (0.5 + 0.5*np.sin(5*group.clock + star_phases))
 
-        # Add twinkling effect
-        for star in stars:
-            star.add_updater(lambda m, dt: m.set_opacity(0.5 + 0.5*np.sin(dt*5)))
+        def twinkle(group, dt):
+            group.clock += dt
+            set_star_opacity(group)
+
+        stars.add_updater(twinkle)
 
         # Slow panning camera movement
         initial_center = ORIGIN
         self.move_camera(frame_center=UP*2 + LEFT*3, run_time=0.1)  # Small but non-zero duration
 
-        # Gradual star appearance
-        star_anim = LaggedStartMap(
-            FadeIn, stars,
-            lag_ratio=0.01,
+        # Gradual star appearance: each star fades in over its own staggered
+        # window, as LaggedStartMap(FadeIn, lag_ratio=0.01) would, but as one
+        # ramp over the opacity array
+        star_lag = 0.01
+        star_span = 1 + star_lag*(num_stars-1)
+        star_start = star_lag*np.arange(num_stars)
+
+        def reveal_stars(group, alpha):
+            local = np.clip(alpha*star_span - star_start, 0, 1)
+            star_reveal[:] = local*local*(3 - 2*local)  # Smoothstep per star
+            set_star_opacity(group)
+
+        star_anim = UpdateFromAlphaFunc(
+            stars, reveal_stars,
             run_time=12,
             rate_func=linear
         )
@@ -70,28 +180,25 @@ class GravitationalWaveSymphony(ThreeDScene):
         wave_tracker = ValueTracker(0)
         resonance = ValueTracker(0)
 
-        # Complex grid deformation with multiple frequency components
+        # Complex grid deformation with multiple frequency components.
+        # Each frame deforms the undeformed rest mesh, so the warp does not
+        # compound on top of the previous frame's result. All lines share
+        # one vertex buffer, warped from the rest mesh in a single call
         def spacetime_warp(mob):
-            t = wave_tracker.get_value()
-            r = resonance.get_value()
-            points = mob.get_points().copy()  # Create a copy of points
-            for i, point in enumerate(points):
-                x, y, _ = point
-                d = np.sqrt(x**2 + y**2)
-
-                # Base wave
-                dx1 = (0.3/(d+0.5)) * np.cos(3*t - 0.7*d)
-                dy1 = (0.3/(d+0.5)) * np.sin(3*t - 0.7*d)
-
-                # Harmonic component
-                dx2 = (0.15*r/(d+1)) * np.cos(5*t - 1.2*d)
-                dy2 = (0.15*r/(d+1)) * np.sin(5*t - 1.2*d)
-
-                # Nonlinear resonance
-                dx3 = 0.1*r**2 * np.exp(-d/4) * np.sin(2*t)
-
-                points[i] = point + np.array([dx1 + dx2 + dx3, dy1 + dy2, 0])
-            mob.set_points(points)
+            if not hasattr(mob, "_rest"):
+                mob._lines = mob.family_members_with_points()
+                mob._rest = np.concatenate([line.points for line in mob._lines])
+                mob._buffer = mob._rest.copy()
+                mob._slices = []
+                start = 0
+                for line in mob._lines:
+                    mob._slices.append(slice(start, start + len(line.points)))
+                    start += len(line.points)
+            # Animations may swap in fresh point arrays; re-bind the views
+            for line, sl in zip(mob._lines, mob._slices):
+                if line.points.base is not mob._buffer:
+                    line.points = mob._buffer[sl]
+            warp_from_rest(mob._rest, mob._buffer, wave_tracker.get_value(), resonance.get_value())
 
         spacetime.add_updater(spacetime_warp)
 
@@ -113,12 +220,25 @@ class GravitationalWaveSymphony(ThreeDScene):
             .set_style(stroke_width=3) for color in [TEAL_A, PINK, BLUE_B]
         ])
 
-        # Pulse animation with dispersion effect
+        # Pulse animation with dispersion effect. Width and (accumulated)
+        # spin are fused into one scaled rotation applied to each layer's
+        # rest points, and opacity is written straight into the RGBA arrays
+        pulse_rest = [layer.points.copy() for layer in pulse_layers]
+        pulse_center = pulse_layers.get_center()[:2]
+        pulse_rest_width = np.array([layer.width for layer in pulse_layers])
+        pulse_spin = np.zeros(len(pulse_layers))
+        pulse_sign = (-1.0)**np.arange(len(pulse_layers))
+
         def pulse_update(mob, alpha):
-            for i, layer in enumerate(mob):
-                layer.set_width(4 + 3*i + 8*alpha)
-                layer.set_opacity(0.3/(i+1) * (1 - alpha))
-                layer.rotate(0.1*alpha * (-1)**i)
+            pulse_spin[:] += 0.1*alpha*pulse_sign
+            scale = (4 + 3*np.arange(len(mob)) + 8*alpha) / pulse_rest_width
+            cos, sin = scale*np.cos(pulse_spin), scale*np.sin(pulse_spin)
+            for i, (layer, rest) in enumerate(zip(mob, pulse_rest)):
+                M = np.array([[cos[i], -sin[i]], [sin[i], cos[i]]])
+                layer.points[:, :2] = (rest[:, :2] - pulse_center) @ M.T + pulse_center
+                opacity = 0.3/(i+1) * (1 - alpha)
+                layer.fill_rgbas[:, 3] = opacity
+                layer.stroke_rgbas[:, 3] = opacity
 
         # Synchronized pulse emission
         self.play(
@@ -136,12 +256,14 @@ class GravitationalWaveSymphony(ThreeDScene):
         # Section 4: Celestial Cartography (2:15-3:00)
         # ======================
         # Mollweide projection with animated contours and constellations
-        sky_map = ParametricSurface(
-            lambda u,v: self.mollweide_projection(u,v),
+        sky_resolution = (round(40*quality), round(20*quality))
+        sky_map = Surface(
+            lambda u,v: np.array([u, v, 0.0]),
             u_range=[-PI, PI],
             v_range=[-PI/2, PI/2],
-            resolution=(40,20)
+            resolution=sky_resolution
         ).set_style(fill_opacity=0.2, stroke_color=WHITE, stroke_width=1)
+        self.project_surface(sky_map)
 
         # Add constellation lines
         constellations = VGroup(*[
@@ -150,18 +272,40 @@ class GravitationalWaveSymphony(ThreeDScene):
         ])
 
         # Animated probability contours
-        contour = always_redraw(lambda:
-            ParametricSurface(
-                lambda u,v: self.mollweide_projection(u,v) + 0.05*np.array([
-                    0,
-                    0,
-                    np.exp(-((u-0.3)**2 + (v-0.2)**2)/0.5) * np.sin(3*wave_tracker.get_value())
-                ]),
-                u_range=[-PI, PI],
-                v_range=[-PI/2, PI/2],
-                resolution=(40,20)
-            ).set_color(interpolate_color(GREEN, YELLOW, 0.5))
-        )
+        # The projected (x, y) mesh never changes, so build the surface once
+        # and only rescale each vertex's height by its Gaussian weight
+        contour = Surface(
+            lambda u,v: np.array([u, v, 0.0]),
+            u_range=[-PI, PI],
+            v_range=[-PI/2, PI/2],
+            resolution=sky_resolution
+        ).set_color(interpolate_color(GREEN, YELLOW, 0.5))
+        contour_faces = contour.family_members_with_points()
+        contour_weights = self.project_surface(contour)
+
+        # Every face's points are a view into one shared vertex buffer, so a
+        # frame updates all heights with a single multiply. Animations that
+        # replace the point arrays (e.g. FadeIn) break the views, so they
+        # are re-bound before writing.
+        face_ends = np.cumsum([len(face.points) for face in contour_faces])
+        face_starts = face_ends - [len(face.points) for face in contour_faces]
+        contour_buffer = np.empty((face_ends[-1], 3))
+
+        def bind_contour_faces():
+            for face, start, end in zip(contour_faces, face_starts, face_ends):
+                view = contour_buffer[start:end]
+                view[:] = face.points
+                face.points = view
+
+        def contour_update(mob):
+            # Animations replace every face's array together, so checking
+            # one face is enough
+            if contour_faces[0].points.base is not contour_buffer:
+                bind_contour_faces()
+            np.multiply(contour_weights, math.sin(3*wave_tracker.get_value()), out=contour_buffer[:, 2])
+
+        contour.add_updater(contour_update)
+        contour_update(contour)
 
         # Final reveal with multiple elements
         self.play(
@@ -172,22 +316,21 @@ class GravitationalWaveSymphony(ThreeDScene):
         )
         self.wait(15)
 
-    def mollweide_projection(self, u, v):
-        # Mollweide projection formula with bounds checking
-        # Ensure inputs are within valid ranges
-        u = np.clip(u, -PI, PI)
-        v = np.clip(v, -PI/2, PI/2)
-
-        theta = u
-        # Add numerical stability to phi calculation
-        arg = (2*v + np.sin(2*v)) / np.pi
-        arg = np.clip(arg, -1, 1)  # Ensure argument is in valid range for arcsin
-        phi = np.arcsin(arg)
-
-        x = 2 * np.sqrt(2) * (theta - np.pi) * np.cos(phi) / np.pi
-        y = np.sqrt(2) * np.sin(phi)
-        z = 0
-        return np.array([x, y, z])
+    def project_surface(self, surface):
+        # Project a surface built on the identity (u, v, 0) mesh to Mollweide
+        # coordinates with one mesh-kernel call for all its faces. Returns
+        # the contour's Gaussian height weight per vertex, in face order
+        faces = surface.family_members_with_points()
+        uv = np.concatenate([face.points[:, :2] for face in faces])
+        xy = np.empty_like(uv)
+        weights = np.empty(len(uv))
+        mollweide_mesh(np.ascontiguousarray(uv[:, 0]), np.ascontiguousarray(uv[:, 1]), xy, weights)
+        start = 0
+        for face in faces:
+            end = start + len(face.points)
+            face.points[:, :2] = xy[start:end]
+            start = end
+        return weights
 
     def get_constellation_lines(self):
         # Define constellation lines (example data)
@@ -1,15 +1,81 @@
+from pathlib import Path
+import sys
+
 from manim import *
+import math
 import numpy as np
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # examples/, for perf_helpers
+from perf_helpers import PointCloud, njit, quality_scale
+
+
+# --- Grid warp kernel: displaces (N, 3) points in place ---
+def grid_warp_numpy(points, t, A, f, k):
+    r = np.hypot(points[:, 0], points[:, 1])
+    moved = r > 0  # The center point stays put
+    phase = 2 * PI * f * (r[moved] - k * t)
+    inv = A / r[moved]
+    points[moved, 0] += inv * np.cos(phase)
+    points[moved, 1] += inv * np.sin(phase)
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def grid_warp(points, t, A, f, k):
+        for i in range(points.shape[0]):
+            x = points[i, 0]
+            y = points[i, 1]
+            r = math.sqrt(x * x + y * y)
+            if r == 0.0:
+                continue
+            phase = 2.0 * math.pi * f * (r - k * t)
+            inv = A / r
+            points[i, 0] = x + inv * math.cos(phase)
+            points[i, 1] = y + inv * math.sin(phase)
+else:
+    grid_warp = grid_warp_numpy
+
+
+# --- Sky map kernel: Mollweide projection fused with the Gaussian height ---
+def sky_map_mesh_numpy(theta, phi, center_theta, center_phi, sigma_theta, sigma_phi, out):
+    theta_rad = np.deg2rad(theta)
+    out[:, 0] = 2 * np.sqrt(2) / PI * np.deg2rad(phi) * np.cos(theta_rad)
+    out[:, 1] = np.sqrt(2) * np.sin(theta_rad)
+    out[:, 2] = 0.3 * np.exp(-((theta - center_theta)**2 / (2 * sigma_theta**2) +
+                               (phi - center_phi)**2 / (2 * sigma_phi**2)))
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def sky_map_mesh(theta, phi, center_theta, center_phi, sigma_theta, sigma_phi, out):
+        for i in range(theta.shape[0]):
+            theta_rad = math.radians(theta[i])
+            out[i, 0] = 2 * math.sqrt(2.0) / math.pi * math.radians(phi[i]) * math.cos(theta_rad)
+            out[i, 1] = math.sqrt(2.0) * math.sin(theta_rad)
+            dt = theta[i] - center_theta
+            dp = phi[i] - center_phi
+            out[i, 2] = 0.3 * math.exp(-(dt * dt / (2 * sigma_theta**2) + dp * dp / (2 * sigma_phi**2)))
+else:
+    sky_map_mesh = sky_map_mesh_numpy
+
+
 class GravitationalWaveVisualization(ThreeDScene):
     def construct(self):
         # --- Scene Setup (as before, but with timing annotations) ---
 
         # --- Background (0-5 seconds) ---
-        num_stars = 200
+        quality = quality_scale()
+        num_stars = int(200*min(quality, 1))
         star_positions = np.random.uniform(-7, 7, size=(num_stars, 3))
-        stars = VGroup(*[Dot(point=pos, radius=0.01 + 0.08*np.random.random(), color=WHITE, fill_opacity=0.2 + 0.8*np.random.random())
-                         for pos in star_positions])
+        star_radii = 0.01 + 0.08*np.random.random(num_stars)
+        star_rgbas = np.ones((num_stars, 4))
+        star_rgbas[:, 3] = 0.2 + 0.8*np.random.random(num_stars)
+        # One point cloud per size class instead of a Dot per star
+        size_class = np.digitize(star_radii, [0.035, 0.065])
+        stars = Group(*[
+            PointCloud(star_positions[size_class == k], star_rgbas[size_class == k], point_size=size)
+            for k, size in enumerate([4, 10, 16])
+        ])
         background = Rectangle(width=20, height=20, color = BLACK, fill_opacity =1).set_z_index(-2)
         self.add(background)
         self.add(stars)
@@ -33,20 +99,16 @@ class GravitationalWaveVisualization(ThreeDScene):
         frequency_tracker = ValueTracker(1)
 
         # --- Grid Transformation ---
-        def grid_transform(point):
-            x, y, z = point
+        # Warps every line's point array in one kernel call per line
+        def grid_transform(mob):
             t = time_tracker.get_value()
             A = amplitude_tracker.get_value()
             f = frequency_tracker.get_value()
             k = 2
-            r = np.sqrt(x**2 + y**2)
-            if r == 0:
-                return np.array([x, y, z])
-            displacement_x = A / r * np.cos(2 * PI * f * (r - k * t))
-            displacement_y = A / r * np.sin(2 * PI * f * (r - k * t))
-            return np.array([x + displacement_x, y + displacement_y, z])
+            for line in mob.family_members_with_points():
+                grid_warp(line.points, t, A, f, k)
 
-        grid.add_updater(lambda m: m.apply_function(grid_transform))
+        grid.add_updater(grid_transform)
 
 
         # --- Pulse (10-25 seconds) ---
@@ -78,17 +140,17 @@ class GravitationalWaveVisualization(ThreeDScene):
         self.wait(7) #  Allow viewing time (total time so far 25 s)
 
 
-
         # --- Sky Projection (25-45 seconds: Setup, 45-90: Animation)---
 
         self.move_camera(phi=75 * DEGREES, theta=-45 * DEGREES)
         axes = ThreeDAxes()
         self.add(axes)
 
+        # Called per sample with scalars, so use the math module (no array boxing)
         def mollweide_projection(theta, phi):
-            phi_rad = np.deg2rad(phi) * np.cos(np.deg2rad(theta))
-            x = 2 * np.sqrt(2) / PI * phi_rad
-            y = np.sqrt(2) * np.sin(np.deg2rad(theta))
+            phi_rad = math.radians(phi) * math.cos(math.radians(theta))
+            x = 2 * math.sqrt(2) / PI * phi_rad
+            y = math.sqrt(2) * math.sin(math.radians(theta))
             return np.array([x, y, 0])
 
         gaussian_center_theta = 30
@@ -96,24 +158,31 @@ class GravitationalWaveVisualization(ThreeDScene):
         gaussian_sigma_theta = 15
         gaussian_sigma_phi = 20
 
-        def bivariate_gaussian(theta, phi):
-            prob = np.exp(-((theta - gaussian_center_theta)**2 / (2 * gaussian_sigma_theta**2) +
-                           (phi - gaussian_center_phi)**2 / (2 * gaussian_sigma_phi**2)))
-            return prob
-
+        # Build the sky map on an identity (theta, phi) mesh, then project
+        # every face vertex and add its Gaussian height in one kernel call
         sky_map = Surface(
-            lambda u, v: np.array([
-                mollweide_projection(u,v)[0],
-                mollweide_projection(u,v)[1],
-                bivariate_gaussian(u, v)  *0.3
-            ]),
+            lambda u, v: np.array([u, v, 0.0]),
             u_range=(0, 180),
             v_range=(-90, 90),
-            resolution=(25, 25),
+            resolution=(round(25*quality), round(25*quality)),
             fill_color=BLUE,
             fill_opacity=0.7,
             stroke_color = BLUE
         )
+        sky_faces = sky_map.family_members_with_points()
+        sky_uv = np.concatenate([face.points for face in sky_faces])
+        sky_points = np.empty_like(sky_uv)
+        sky_map_mesh(
+            np.ascontiguousarray(sky_uv[:, 0]), np.ascontiguousarray(sky_uv[:, 1]),
+            gaussian_center_theta, gaussian_center_phi,
+            gaussian_sigma_theta, gaussian_sigma_phi,
+            sky_points
+        )
+        start = 0
+        for face in sky_faces:
+            end = start + len(face.points)
+            face.points[:] = sky_points[start:end]
+            start = end
 
         sky_map.set_style(fill_opacity=0.7)
         sky_map.set_fill_by_checkerboard(BLUE, YELLOW, opacity=0.7)
@@ -164,7 +233,7 @@ class GravitationalWaveVisualization(ThreeDScene):
         self.wait(10)  # Allow final state to be seen
 
         # --- Fade Out (130-140 seconds) ---
-        self.play(*[FadeOut(mob) for mob in self.mobjects], run_time=10)  # Slow fade out
+        self.play(FadeOut(Group(*self.mobjects)), run_time=10)  # Slow fade out, one animation
         self.wait(5) # final black
 
         # Final Time: ~ 145 s
\ No newline at end of file
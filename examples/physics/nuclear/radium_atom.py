@@ -1,6 +1,112 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
 from manim import *
+import math
+import os
+import subprocess
+import sys
 import numpy as np
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # examples/, for perf_helpers
+from perf_helpers import njit
+
+
+@lru_cache(maxsize=None)
+def _build_text(text, **kwargs):
+    return Text(text, **kwargs)
+
+
+def cached_text(text, **kwargs):
+    """Return a copy of a Text, shaping each (string, style) only once"""
+    return _build_text(text, **kwargs).copy()
+
+
+# Van Aken-Simar constants for 8 eighth-turn arcs: tau = 4/3*tan(pi/16)
+# is the tangent handle length, sincos = cos(pi/4) = sin(pi/4)
+ELLIPSE_TAU = 0.265216489839544
+ELLIPSE_SINCOS = 0.7071067811865475
+
+
+def _ellipse_cbez8(C, P, Q):
+    """Cubic Bezier control points (8, 4, 2) for the ellipse C + P cos t + Q sin t
+
+    P and Q are conjugate semi-diameters; each step rotates the pair by
+    pi/4 with adds and one shared scale, so no per-point trig is needed.
+    """
+    C, P, Q = (np.asarray(v, dtype=float) for v in (C, P, Q))
+    arcs = np.empty((8, 4, 2))
+    for k in range(8):
+        p1 = C + P
+        arcs[k, 0] = p1
+        arcs[k, 1] = p1 + ELLIPSE_TAU*Q
+        tmp = ELLIPSE_SINCOS*(P + Q)
+        Q = ELLIPSE_SINCOS*(Q - P)
+        P = tmp
+        p2 = C + P
+        arcs[k, 2] = p2 - ELLIPSE_TAU*Q
+        arcs[k, 3] = p2
+    return arcs
+
+
+@lru_cache(maxsize=None)
+def _rot_matrices(n):
+    """(n, 2, 2) rotation matrices for the family angles theta_k = 2 pi k / n"""
+    angles = np.arange(n) * (2 * PI / n)
+    cos_a, sin_a = np.cos(angles), np.sin(angles)
+    rotations = np.stack([
+        np.stack([cos_a, -sin_a], axis=-1),
+        np.stack([sin_a, cos_a], axis=-1)
+    ], axis=1)
+    rotations.flags.writeable = False  # Shared between callers
+    return rotations
+
+
+def advance_electrons_numpy(t, a, b, theta, speed, dt, out):
+    # Advance each electron's proportion t in place and write its position
+    # R_theta (a cos 2pi t, b sin 2pi t) into the rows of out
+    t += speed * dt
+    t %= 1
+    x = a * np.cos(TAU * t)
+    y = b * np.sin(TAU * t)
+    cos_theta = np.cos(theta)
+    sin_theta = np.sin(theta)
+    out[:, 0] = cos_theta * x - sin_theta * y
+    out[:, 1] = sin_theta * x + cos_theta * y
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def advance_electrons(t, a, b, theta, speed, dt, out):
+        for i in range(t.shape[0]):
+            t[i] = (t[i] + speed[i] * dt) % 1.0
+            x = a[i] * math.cos(2 * math.pi * t[i])
+            y = b[i] * math.sin(2 * math.pi * t[i])
+            cos_theta = math.cos(theta[i])
+            sin_theta = math.sin(theta[i])
+            out[i, 0] = cos_theta * x - sin_theta * y
+            out[i, 1] = sin_theta * x + cos_theta * y
+else:
+    advance_electrons = advance_electrons_numpy
+
+
+def _advance_electron_group(electrons, state, dt):
+    # state is the preallocated (t, a, b, theta, speed, positions) arrays
+    positions = state[5]
+    advance_electrons(*state[:5], dt, positions)
+    for electron, position in zip(electrons, positions):
+        electron.move_to(position)
+
+
+def bezier_ellipse(a, b, **kwargs):
+    """Origin-centred ellipse with semi-axes a, b built from _ellipse_cbez8"""
+    points = np.zeros((32, 3))
+    points[:, :2] = _ellipse_cbez8((0, 0), (a, 0), (0, b)).reshape(-1, 2)
+    ellipse = VMobject(**kwargs)
+    ellipse.set_points(points)
+    return ellipse
+
+
 class RadiumAtomStructure(Scene):
     def construct(self):
         # Constants and parameters
@@ -8,6 +114,10 @@ class RadiumAtomStructure(Scene):
         NUCLEUS_RADIUS = 0.05
         LAMBDA = 0.7  # Scaling factor for inner orbits
         
+        # Every orbit family is collected into this one group as it is
+        # created, and the same group is faded in and out throughout
+        all_orbits = VGroup()
+        
         # Setup title and introduction
         self.introduce_topic()
         
@@ -16,13 +126,15 @@ class RadiumAtomStructure(Scene):
         self.play(Create(nucleus))
         
         # Add the primary orbits (red)
+        red_a, red_b = 5.2, 3.6
         red_orbits = self.create_orbit_family(
-            a=5.2, 
-            b=3.6, 
+            a=red_a, 
+            b=red_b, 
             num_orbits=4, 
             color=RED, 
             z_index=1
         )
+        all_orbits.add(*red_orbits)
         self.play(
             *[Create(orbit) for orbit in red_orbits],
             run_time=2
@@ -36,13 +148,14 @@ class RadiumAtomStructure(Scene):
             color=WHITE, 
             z_index=2
         )
+        all_orbits.add(*black_orbits)
         self.play(
             *[Create(orbit) for orbit in black_orbits],
             run_time=2
         )
         
         # Add inner orbital families with progressively smaller sizes
-        all_inner_orbits = []
+        all_inner_orbits = VGroup()
         for i in range(3, 8):
             a_i = LAMBDA**(i-2) * 4.8
             b_i = LAMBDA**(i-2) * 3.2
@@ -61,20 +174,22 @@ class RadiumAtomStructure(Scene):
                 z_index=i
             )
             
-            all_inner_orbits.extend(inner_orbits)
+            all_inner_orbits.add(*inner_orbits)
+            all_orbits.add(*inner_orbits)
             self.play(
                 *[Create(orbit) for orbit in inner_orbits],
                 run_time=1.5
             )
         
         # Highlight the nodal points
-        self.explain_nodal_points(red_orbits[0], black_orbits[0])
+        self.explain_nodal_points(red_a, red_b, theta=0)
         
         # Fade out all orbits and nucleus after explaining nodal points
         # This will make the mathematical explanations more visible
-        all_orbits = VGroup(*red_orbits, *black_orbits, *all_inner_orbits)
+        # The orbits are unchanged until they return, so hide them by
+        # animating their stroke opacity rather than removing them
         self.play(
-            FadeOut(all_orbits),
+            all_orbits.animate.set_stroke(opacity=0),
             FadeOut(nucleus),
             run_time=1.5
         )
@@ -84,7 +199,7 @@ class RadiumAtomStructure(Scene):
         
         # Fade the orbits back in for electron motion
         self.play(
-            FadeIn(all_orbits),
+            all_orbits.animate.set_stroke(opacity=0.8),
             FadeIn(nucleus),
             run_time=1.5
         )
@@ -107,8 +222,8 @@ class RadiumAtomStructure(Scene):
     
     def introduce_topic(self):
         """Introduction to the radium atom animation"""
-        title = Text("Structure of the Radium Atom", font_size=40)
-        subtitle = Text("Bohr-Sommerfeld Model", font_size=30, color=BLUE)
+        title = cached_text("Structure of the Radium Atom", font_size=40)
+        subtitle = cached_text("Bohr-Sommerfeld Model", font_size=30, color=BLUE)
         subtitle.next_to(title, DOWN)
         
         # Group the title elements
@@ -134,10 +249,10 @@ class RadiumAtomStructure(Scene):
         """Create the radium nucleus"""
         nucleus = Circle(radius=0.05, color=YELLOW, fill_opacity=1)
         
-        # Add a pulsing animation to the nucleus
+        # Add a pulsing animation to the nucleus (scalar time, so math.sin)
         nucleus.add_updater(
             lambda m, dt: m.set_opacity(
-                0.7 + 0.3 * np.sin(0.5 * self.time)
+                0.7 + 0.3 * math.sin(0.5 * self.time)
             )
         )
         
@@ -145,46 +260,54 @@ class RadiumAtomStructure(Scene):
     
     def create_orbit_family(self, a, b, num_orbits, color, z_index=0):
         """Create a family of elliptical orbits with rotational symmetry"""
-        orbits = []
+        orbits = VGroup()
         
-        for k in range(num_orbits):
+        # Sample the elliptical path once; every orbit in the family is a
+        # copy with the base points rotated about the origin
+        base = bezier_ellipse(
+            a, 
+            b, 
+            color=color,
+            stroke_opacity=0.8
+        )
+        base_points = base.points.copy()
+        
+        for k, R in enumerate(_rot_matrices(num_orbits)):
             theta = k * (2 * PI / num_orbits)
-            
-            # Create the elliptical path
-            ellipse = Ellipse(
-                width=2*a, 
-                height=2*b, 
-                color=color,
-                stroke_opacity=0.8
-            )
+            ellipse = base.copy()
             
             # Apply rotation
-            ellipse.rotate(theta)
+            ellipse.points[:, :2] = base_points[:, :2] @ R.T
             ellipse.z_index = z_index
+            ellipse.orbit_params = (a, b, theta)
             
-            orbits.append(ellipse)
+            orbits.add(ellipse)
             
         return orbits
     
-    def explain_nodal_points(self, red_orbit, black_orbit):
-        """Explain the nodal points using an example orbit"""
+    def explain_nodal_points(self, a, b, theta):
+        """Explain the nodal points using an example orbit of semi-axes a, b rotated by theta"""
         # Create the explanation text
-        nodal_title = Text("Nodal Points", font_size=36)
+        nodal_title = cached_text("Nodal Points", font_size=36)
         nodal_title.to_edge(UP, buff=1.5)
         
         # Define and highlight nodal points
         nodal_eq = MathTex(r"\frac{dr}{dt} = 0", font_size=30)
         nodal_eq.next_to(nodal_title, DOWN)
         
-        # Add points to highlight major and minor axis nodes on the red orbit
+        # Add points to highlight major and minor axis nodes on the orbit,
+        # evaluated directly from the rotated parametric form
+        c, s = np.cos(theta), np.sin(theta)
+        R = np.array([[c, -s], [s, c]])
+        major = R @ np.array([[a, -a], [0, 0]])
+        minor = R @ np.array([[0, 0], [b, -b]])
+        
         major_nodes = [
-            Dot(red_orbit.point_from_proportion(0), color=YELLOW, radius=0.05),
-            Dot(red_orbit.point_from_proportion(0.5), color=YELLOW, radius=0.05)
+            Dot([x, y, 0], color=YELLOW, radius=0.05) for x, y in major.T
         ]
         
         minor_nodes = [
-            Dot(red_orbit.point_from_proportion(0.25), color=GREEN, radius=0.05),
-            Dot(red_orbit.point_from_proportion(0.75), color=GREEN, radius=0.05)
+            Dot([x, y, 0], color=GREEN, radius=0.05) for x, y in minor.T
         ]
         
         # Labels for the nodal points
@@ -193,24 +316,6 @@ class RadiumAtomStructure(Scene):
         gamma = MathTex(r"\gamma", color=GREEN).next_to(minor_nodes[0], UL, buff=0.1)
         delta = MathTex(r"\delta", color=GREEN).next_to(minor_nodes[1], DR, buff=0.1)
         
-        # Create the animations
-        self.play(Write(nodal_title), run_time=1)
-        self.play(Write(nodal_eq), run_time=1)
-        
-        # Create major nodes
-        self.play(
-            *[Create(node) for node in major_nodes],
-            Write(alpha), Write(beta),
-            run_time=1.5
-        )
-        
-        # Create minor nodes
-        self.play(
-            *[Create(node) for node in minor_nodes],
-            Write(gamma), Write(delta),
-            run_time=1.5
-        )
-        
         # Explain where they occur
         major_axis_formula = MathTex(r"t = \{0, \pi\} \text{ for major axis nodes}")
         minor_axis_formula = MathTex(r"t = \{\frac{\pi}{2}, \frac{3\pi}{2}\} \text{ for minor axis nodes}")
@@ -218,20 +323,33 @@ class RadiumAtomStructure(Scene):
         formulas = VGroup(major_axis_formula, minor_axis_formula).arrange(DOWN)
         formulas.next_to(nodal_eq, DOWN, buff=0.5)
         
-        self.play(Write(formulas), run_time=2)
-        self.wait(1)
-        
+        # Create the animations as one sequence: title, equation, major
+        # nodes, minor nodes, then the formulas
+        self.play(Succession(
+            Write(nodal_title, run_time=1),
+            Write(nodal_eq, run_time=1),
+            AnimationGroup(
+                *[Create(node) for node in major_nodes],
+                Write(alpha), Write(beta),
+                run_time=1.5
+            ),
+            AnimationGroup(
+                *[Create(node) for node in minor_nodes],
+                Write(gamma), Write(delta),
+                run_time=1.5
+            ),
+            Write(formulas, run_time=2)
+        ))
         # Clean up
-        self.play(
-            FadeOut(nodal_title), FadeOut(nodal_eq), FadeOut(formulas),
-            *[FadeOut(node) for node in major_nodes + minor_nodes],
-            FadeOut(alpha), FadeOut(beta), FadeOut(gamma), FadeOut(delta),
-            run_time=1
+        self._hold_and_clear(
+            [nodal_title, nodal_eq, formulas, *major_nodes, *minor_nodes,
+             alpha, beta, gamma, delta],
+            hold=1
         )
     
     def explain_quantization(self):
         """Explain the quantization rule and its significance"""
-        quant_title = Text("Orbital Quantization", font_size=36)
+        quant_title = cached_text("Orbital Quantization", font_size=36)
         quant_title.to_edge(UP, buff=1.5)
         
         # Show the Bohr-Sommerfeld quantization rule
@@ -263,18 +381,15 @@ class RadiumAtomStructure(Scene):
         
         self.play(Write(angle_pattern), run_time=1)
         self.play(Write(angle_explanation), run_time=1.5)
-        self.wait(2)
-        
         # Clean up
-        self.play(
-            FadeOut(quant_title), FadeOut(quant_rule), FadeOut(explanation),
-            FadeOut(angle_pattern), FadeOut(angle_explanation),
-            run_time=1
+        self._hold_and_clear(
+            [quant_title, quant_rule, explanation, angle_pattern, angle_explanation],
+            hold=2
         )
     
     def animate_electrons(self, red_orbits, black_orbits, inner_orbits):
         """Animate electrons moving along the orbits"""
-        electron_title = Text("Electron Motion", font_size=36)
+        electron_title = cached_text("Electron Motion", font_size=36)
         electron_title.to_edge(UP, buff=1.5)
         
         # Formula for electron position
@@ -296,65 +411,67 @@ class RadiumAtomStructure(Scene):
         self.play(Write(position_formula), run_time=1.5)
         self.play(Write(frequency_formula), run_time=1)
         
-        # Create electrons for animation
-        electrons = []
+        # Create electrons for animation. Their state is kept as arrays,
+        # one entry per electron: proportion t along the orbit, the orbit's
+        # semi-axes a, b and rotation theta, and the speed
+        orbits = []
+        colors = []
+        speeds = []
         
         # Generate 2 electrons for red orbits (slower)
         for orbit in red_orbits[:2]:
-            electron = Dot(color=RED_A, radius=0.03)
-            # Place at random position on the orbit
-            t = np.random.random() * TAU
-            electron.move_to(orbit.point_from_proportion(t/TAU))
-            electrons.append((electron, orbit, 0.5))  # (electron, orbit, speed)
+            orbits.append(orbit)
+            colors.append(RED_A)
+            speeds.append(0.5)
         
         # Generate 3 electrons for black orbits (medium speed)
         for orbit in black_orbits[:3]:
-            electron = Dot(color=WHITE, radius=0.03)
-            t = np.random.random() * TAU
-            electron.move_to(orbit.point_from_proportion(t/TAU))
-            electrons.append((electron, orbit, 0.7))
+            orbits.append(orbit)
+            colors.append(WHITE)
+            speeds.append(0.7)
         
         # Generate 4 electrons for inner orbits (faster)
         for orbit in inner_orbits[:4]:
-            electron = Dot(color=BLUE_A, radius=0.03)
-            t = np.random.random() * TAU
-            electron.move_to(orbit.point_from_proportion(t/TAU))
-            electrons.append((electron, orbit, 1.0))
+            orbits.append(orbit)
+            colors.append(BLUE_A)
+            speeds.append(1.0)
+        
+        a, b, theta = (np.ascontiguousarray(v) for v in np.array([o.orbit_params for o in orbits]).T)
+        speed = np.array(speeds)
+        # Place each electron at a random position on its orbit, drawn in
+        # one seeded batch so renders are reproducible
+        rng = np.random.default_rng(0)
+        t = rng.random(len(orbits))
+        positions = np.zeros((len(orbits), 3))
+        advance_electrons(t, a, b, theta, speed, 0.0, positions)
+        
+        electrons = VGroup(*[
+            Dot(position, color=color, radius=0.03)
+            for position, color in zip(positions, colors)
+        ])
         
         # Add the electrons to the scene
-        self.play(*[FadeIn(e[0]) for e in electrons], run_time=1)
-        
-        # Add the electron updaters
-        def electron_updater(electron, orbit, speed, dt):
-            # The current proportion along the curve
-            curr_t = orbit.proportion_from_point(electron.get_center())
-            if curr_t is None:
-                curr_t = 0
-            # Advance by speed * dt
-            new_t = (curr_t + speed * dt) % 1
-            # Move to the new position
-            electron.move_to(orbit.point_from_proportion(new_t))
-        
-        # Apply the updaters
-        for e, orbit, speed in electrons:
-            e.add_updater(lambda m, dt, o=orbit, s=speed: electron_updater(m, o, s, dt))
+        self.play(FadeIn(electrons), run_time=1)
+        
+        # One updater advances every electron with a single kernel call
+        state = (t, a, b, theta, speed, positions)
+        electrons.add_updater(lambda m, dt, st=state: _advance_electron_group(m, st, dt))
         
         # Let the animation run for a while
         self.wait(5)
         
         # Remove the updaters and clean up
-        for e, _, _ in electrons:
-            e.clear_updaters()
+        electrons.clear_updaters()
         
         self.play(
             FadeOut(electron_title), FadeOut(position_formula), FadeOut(frequency_formula),
-            *[FadeOut(e[0]) for e in electrons],
+            FadeOut(electrons),
             run_time=1
         )
     
     def explain_energy_levels(self):
         """Explain the energy levels in the Bohr model"""
-        energy_title = Text("Energy Levels", font_size=36)
+        energy_title = cached_text("Energy Levels", font_size=36)
         energy_title.to_edge(UP, buff=1.5)
         
         # Energy formula
@@ -378,17 +495,18 @@ class RadiumAtomStructure(Scene):
         
         energy_diagram = VGroup()
         
+        # All level line endpoints at once, one row per level
+        ys = -2 - np.arange(1, levels+1)*level_height
+        starts = np.column_stack([np.full(levels, -level_width/2), ys, np.zeros(levels)])
+        ends = np.column_stack([np.full(levels, level_width/2), ys, np.zeros(levels)])
+        
         # Create energy level lines
-        for n in range(1, levels+1):
+        for n, start, end in zip(range(1, levels+1), starts, ends):
             # Calculate energy proportion for visualization (not to scale)
             energy_prop = 1/n**2
             
             # Create line
-            line = Line(
-                start=[-level_width/2, -2 - n*level_height, 0],
-                end=[level_width/2, -2 - n*level_height, 0],
-                color=BLUE
-            )
+            line = Line(start=start, end=end, color=BLUE)
             
             # Add label
             label = MathTex(f"n={n}", font_size=24)
@@ -409,18 +527,15 @@ class RadiumAtomStructure(Scene):
         self.play(Write(radium_energy), run_time=1.5)
         self.play(Create(energy_diagram), run_time=2)
         
-        self.wait(2)
-        
         # Clean up
-        self.play(
-            FadeOut(energy_title), FadeOut(energy_formula), 
-            FadeOut(radium_energy), FadeOut(energy_diagram),
-            run_time=1
+        self._hold_and_clear(
+            [energy_title, energy_formula, radium_energy, energy_diagram],
+            hold=2
         )
     
     def conclusion(self):
         """Conclude the animation"""
-        conclusion_text = Text("The Bohr-Sommerfeld Model", font_size=36)
+        conclusion_text = cached_text("The Bohr-Sommerfeld Model", font_size=36)
         conclusion_text.to_edge(UP, buff=1.5)
         
         points = VGroup(
@@ -443,26 +558,31 @@ class RadiumAtomStructure(Scene):
         # Show conclusion
         self.play(Write(conclusion_text), run_time=1)
         
-        for point in points:
-            self.play(Write(point), run_time=0.8)
+        # One staggered reveal of all bullet points in a single play call
+        self.play(
+            LaggedStart(*[Write(point) for point in points], lag_ratio=0.4),
+            run_time=0.8 * len(points)
+        )
         
         self.play(Write(final_text), run_time=1)
-        self.wait(2)
-        
         # Final fade out
-        self.play(
-            FadeOut(conclusion_text),
-            FadeOut(points),
-            FadeOut(final_text),
-            run_time=2
+        self._hold_and_clear(
+            [conclusion_text, points, final_text],
+            hold=2,
+            clear_time=2
         )
+    
+    def _hold_and_clear(self, mobs, hold, clear_time=1):
+        """Hold a finished section on screen, then fade it out as one group"""
+        self.wait(hold)
+        self.play(FadeOut(VGroup(*mobs)), run_time=clear_time)
 
 
 class RotationTransformation(Scene):
     """Demonstrates how rotation matrix transforms elliptical orbits"""
     def construct(self):
         # Create title
-        title = Text("Orbital Rotation Transformations", font_size=40)
+        title = cached_text("Orbital Rotation Transformations", font_size=40)
         title.to_edge(UP)
         self.play(Write(title), run_time=1)
         
@@ -482,10 +602,15 @@ class RotationTransformation(Scene):
         num_orbits = 6
         rotated_ellipses = []
         
-        for k in range(num_orbits):
-            theta = k * (2 * PI / num_orbits)
-            rotated = Ellipse(width=2*a, height=2*b, color=RED_A)
-            rotated.rotate(theta)
+        # Rotate one sampled ellipse by every theta_k in a single batched
+        # product: all_points[k] = points @ R_k^T
+        template = bezier_ellipse(a, b, color=RED_A)
+        rotations = _rot_matrices(num_orbits)
+        all_points = np.einsum('ij,kjl->kil', template.points[:, :2], rotations.transpose(0, 2, 1))
+        
+        for points in all_points:
+            rotated = template.copy()
+            rotated.points[:, :2] = points
             rotated_ellipses.append(rotated)
         
         # Show base ellipse first
@@ -528,7 +653,7 @@ class ParametricEllipseScene(Scene):
     """Demonstrates the parametric equation of an ellipse"""
     def construct(self):
         # Title
-        title = Text("Parametric Equation of an Ellipse", font_size=40)
+        title = cached_text("Parametric Equation of an Ellipse", font_size=40)
         title.to_edge(UP)
         self.play(Write(title), run_time=1)
         
@@ -603,28 +728,40 @@ class ParametricEllipseScene(Scene):
             run_time=2
         )
         
+        # The parameter t drives the dot from its closed form on both passes
+        t_tracker = ValueTracker(0)
+        
+        # Position updater for the dot
+        def update_dot(m):
+            t = t_tracker.get_value()
+            m.move_to(axes.c2p(a*math.cos(t), b*math.sin(t)))
+        
+        dot.add_updater(update_dot)
+        
         # Animate the dot along the ellipse
         self.play(
-            MoveAlongPath(dot, ellipse),
+            t_tracker.animate.set_value(TAU),
             run_time=4,
             rate_func=linear
         )
+        t_tracker.set_value(0)
         
         # Show the parameter t
-        t_tracker = ValueTracker(0)
-        
         t_pointer = Vector([1, 0], color=RED)
         t_pointer.move_to(axes.c2p(0, 0))
         
         t_label = MathTex("t", font_size=24, color=RED)
-        t_label.add_updater(
-            lambda m: m.next_to(
-                axes.c2p(1.5*np.cos(t_tracker.get_value()), 
-                         1.5*np.sin(t_tracker.get_value())),
-                direction=RIGHT if np.cos(t_tracker.get_value()) > 0 else LEFT,
+        # Scalar per-frame trig, so use math rather than numpy
+        def update_t_label(m):
+            t = t_tracker.get_value()
+            cos_t = math.cos(t)
+            m.next_to(
+                axes.c2p(1.5*cos_t, 1.5*math.sin(t)),
+                direction=RIGHT if cos_t > 0 else LEFT,
                 buff=0.1
             )
-        )
+        
+        t_label.add_updater(update_t_label)
         
         def update_pointer(mob):
             angle = t_tracker.get_value()
@@ -635,16 +772,6 @@ class ParametricEllipseScene(Scene):
         
         t_pointer.add_updater(update_pointer)
         
-        # Position updater for the dot
-        dot.add_updater(
-            lambda m: m.move_to(
-                axes.c2p(
-                    a*np.cos(t_tracker.get_value()),
-                    b*np.sin(t_tracker.get_value())
-                )
-            )
-        )
-        
         # Add the pointer and label
         self.play(
             Create(t_pointer),
@@ -672,8 +799,8 @@ class ParametricEllipseScene(Scene):
 class RadiumAtomFullAnimation(Scene):
     def construct(self):
         # Show title sequence
-        title = Text("The Radium Atom", font_size=48)
-        subtitle = Text("Bohr-Sommerfeld Model Visualization", font_size=32)
+        title = cached_text("The Radium Atom", font_size=48)
+        subtitle = cached_text("Bohr-Sommerfeld Model Visualization", font_size=32)
         subtitle.next_to(title, DOWN)
         
         title_group = VGroup(title, subtitle)
@@ -721,7 +848,26 @@ class RadiumAtomFullAnimation(Scene):
         )
 
 
+SCENE_NAMES = [
+    "ParametricEllipseScene",
+    "RotationTransformation",
+    "RadiumAtomStructure",
+    "RadiumAtomFullAnimation",
+]
+
+
+def render_scene(scene_name, quality="-qh"):
+    """Render one scene of this file in its own manim process"""
+    return subprocess.run(
+        [sys.executable, "-m", "manim", quality, __file__, scene_name],
+        check=False
+    ).returncode
+
+
 if __name__ == "__main__":
-    # Uncomment the scene you want to render
-    # Command to render: manim -pqh radium_atom.py RadiumAtomFullAnimation
-    pass
\ No newline at end of file
+    # The scenes share no state, so render them all concurrently:
+    #   python radium_atom.py
+    # or render a single one with: manim -pqh radium_atom.py SceneName
+    with ThreadPoolExecutor(max_workers=min(len(SCENE_NAMES), os.cpu_count() or 1)) as pool:
+        return_codes = list(pool.map(render_scene, SCENE_NAMES))
+    sys.exit(max(return_codes))
@@ -1,22 +1,40 @@
+from pathlib import Path
+import sys
+
 from manim import *
-from random import uniform
 import numpy as np
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # examples/, for perf_helpers
+from perf_helpers import vectorized_surface
+
+
 def SurroundingCircle(mobject, color=BLUE, buffer_factor=1.5):
     width = mobject.get_width()
     height = mobject.get_height()
     radius = max(width, height) / 2 * buffer_factor
     return Circle(radius=radius, color=color).move_to(mobject.get_center())
 
+
+def loop_points(t):
+    # Higher-order correction loop: circle of radius 0.5, one row per sample
+    return np.column_stack([0.5*np.cos(t), 0.5*np.sin(t), np.zeros_like(t)])
+
+
+def wave_packet_points(t):
+    # Gaussian-modulated wave packet, one row per sample
+    return np.column_stack([t/2, 0.3*np.exp(-t**2)*np.sin(8*t), np.zeros_like(t)])
+
+
 class QFTRevolution(ThreeDScene):
     def construct(self):
         # Scene 1: Quantum Field Visualization (3D) - 15 seconds
         self.set_camera_orientation(phi=75*DEGREES, theta=-45*DEGREES)
-        field_grid = Surface(
-            lambda u, v: np.array([u, v, 0.5*np.sin(3*u)*np.cos(3*v)]),
+        # Lift every vertex at once with the field height
+        field_grid = vectorized_surface(
+            lambda u, v: (u, v, 0.5*np.sin(3*u)*np.cos(3*v)),
             u_range=[-3,3], v_range=[-3,3],
-            checkerboard_colors=[BLUE_E, GREEN_E],
-            resolution=(24,24)
+            resolution=(24,24),
+            checkerboard_colors=[BLUE_E, GREEN_E]
         )
 
         field_eq = MathTex(
@@ -33,11 +51,15 @@ class QFTRevolution(ThreeDScene):
         self.play(FadeOut(field_grid, field_eq), run_time=2)
 
         # Scene 2: Vacuum Fluctuations - 20 seconds
+        # Draw every dot's position, radius and color mix in single batches
+        rng = np.random.default_rng()
+        foam_xy = rng.uniform([-5,-3], [5,3], (200,2))
+        foam_radii = 0.03*rng.random(200)
+        foam_mix = rng.random(200)[:, None]
+        foam_rgb = (1-foam_mix)*color_to_rgb(WHITE) + foam_mix*color_to_rgb(BLUE_E)
         quantum_foam = VGroup(*[
-            Dot(point=[uniform(-5,5), uniform(-3,3),0],
-               radius=0.03*uniform(0,1),
-               color=interpolate_color(WHITE, BLUE_E, uniform(0,1)))
-            for _ in range(200)
+            Dot(point=[x, y, 0], radius=r, color=rgb_to_color(rgb))
+            for (x, y), r, rgb in zip(foam_xy, foam_radii, foam_rgb)
         ])
         uncertainty_eq = MathTex(
             r"\Delta E \Delta t \geq \frac{\hbar}{2}",
@@ -53,7 +75,7 @@ class QFTRevolution(ThreeDScene):
         ).arrange(RIGHT, buff=2)
         self.play(Create(virtual_pairs), run_time=3)
         self.wait(2)
-        self.play(FadeOut(*self.mobjects))
+        self.play(FadeOut(quantum_foam, uncertainty_eq, virtual_pairs))
 
         # Scene 3: Feynman Diagrams & Interactions - 25 seconds
         diagram = VGroup(
@@ -77,14 +99,13 @@ class QFTRevolution(ThreeDScene):
         self.wait(5)
 
         # Add loop diagram (representing a higher-order correction)
-        loop = ParametricFunction(
-            lambda t: np.array([0.5*np.cos(t), 0.5*np.sin(t), 0]),
-            t_range=[0, TAU],
-            color=GREEN
+        # All samples are evaluated in one NumPy call, then fitted smoothly
+        loop = VMobject(color=GREEN).set_points_smoothly(
+            loop_points(np.linspace(0, TAU, 65))
         ).shift(RIGHT) #Shift to see the result
         self.play(Create(loop), run_time=2)
         self.wait(3)
-        self.play(FadeOut(*self.mobjects))
+        self.play(FadeOut(diagram, matrix_element, caption, loop))
 
         # Scene 4: Renormalization Process - 25 seconds
         bare_particle = Circle(radius=0.5, color=RED)
@@ -104,14 +125,12 @@ class QFTRevolution(ThreeDScene):
         self.play(TransformMatchingShapes(bare_particle, renorm_group[0]), Write(renorm_eq[1])) #Transition between bare particle and dressed particle
         self.play(FadeIn(renorm_group[1])) #Show blue circle
         self.wait(5)
-        self.play(FadeOut(*self.mobjects))
+        self.play(FadeOut(renorm_group, renorm_eq))
 
         # Scene 5: Detector Thought Experiment - 30 seconds
         detector = Rectangle(height=2, width=3, color=GREY_B)
-        wave_packet = ParametricFunction(
-            lambda t: np.array([t/2, 0.3*np.exp(-t**2)*np.sin(8*t), 0]),  # Gaussian wave packet
-            t_range=[-3,3],
-            color=BLUE
+        wave_packet = VMobject(color=BLUE).set_points_smoothly(
+            wave_packet_points(np.linspace(-3, 3, 301))  # Gaussian wave packet
         ).shift(LEFT*3)
         excitation = Star(n=7, color=YELLOW).scale(0.3).move_to(detector.get_center()) # Star for simple excitation
 
@@ -122,20 +141,27 @@ class QFTRevolution(ThreeDScene):
 
         # Replace image-based chambers with Manim-generated representations
         # Cloud Chamber Representation:  Lines indicating particle tracks
+        # Track endpoints are computed as (N, 3) arrays around one center
+        center = detector.get_center()
+        i = np.arange(5)
+        track_starts = center + np.column_stack([-i*0.2, np.zeros(5), np.zeros(5)])
+        track_ends = center + np.column_stack([3 - i*0.2, rng.uniform(-0.5, 0.5, 5), np.zeros(5)])
         cloud_chamber = VGroup(*[
-            Line(start=detector.get_center() + LEFT * i * 0.2, end=detector.get_center() + RIGHT * (3 - i * 0.2) + UP*uniform(-0.5, 0.5), color=WHITE)
-            for i in range(5)
+            Line(start=start, end=end, color=WHITE)
+            for start, end in zip(track_starts, track_ends)
         ]).shift(LEFT*3)
 
         # Bubble Chamber Representation:  Dots along a path
+        i = np.arange(15)
+        bubble_points = center + np.column_stack([i*0.2, np.sin(i*0.5)*0.3, np.zeros(15)])
         bubble_chamber = VGroup(*[
-            Dot(point=detector.get_center() + RIGHT * i * 0.2 + UP * np.sin(i*0.5)*0.3, radius=0.05, color=WHITE)
-            for i in range(15)
+            Dot(point=point, radius=0.05, color=WHITE)
+            for point in bubble_points
         ]).shift(RIGHT*3)
 
         self.play(Create(cloud_chamber), Create(bubble_chamber))  # Use Create for the tracks
         self.wait(5)
-        self.play(FadeOut(*self.mobjects))
+        self.play(FadeOut(detector, wave_packet, excitation, cloud_chamber, bubble_chamber))
 
         # Scene 6: Synthesis & Conclusion - 25 seconds
         final_text = VGroup(